@@ -10,16 +10,25 @@ from __future__ import annotations
 
 __version__ = "0.1.1-alpha"
 
+import hashlib
 import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
 from contextlib import asynccontextmanager
 from typing import Any
 
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import PlainTextResponse
+import orjson
+from fastapi import FastAPI, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, PlainTextResponse
 from pydantic import BaseModel, Field
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 # Local modules
-from core.audit import audit_log
+from core.audit import audit_log, get_prometheus_metrics_bytes, metrics_reset_enabled
 from core.memory import MemoryManager, clean_telemetry
 from cli import (
     DATA_ARCHITECT_WHITELIST,
@@ -28,66 +37,180 @@ from cli import (
     Persona,
     SecurityViolation,
     ToolExecutor,
+    _normalize_persona_str,
 )
 
+
 # --- State (lazy init) -------------------------------------------------------
 
 _memory: MemoryManager | None = None
 _executor: ToolExecutor | None = None
-_API_KEY_MAP: dict[str, set[str]] | None = None
+_PERSONAS = frozenset(p.value for p in Persona)
+
+# Auth config (see _load_auth_config)
+_API_KEY_MAP: Mapping[str, frozenset[str]] = {}
+# Keys accepted per persona (its own plus "*" keys); personas without their own keys use the wildcard set.
+_MERGED_KEYS_BY_PERSONA: Mapping[str, frozenset[str]] = {}
+_WILDCARD_KEYS: frozenset[str] = frozenset()
+_AUTH_REQUIRED = False
+_JWT_SECRET: str | None = None
+# No keys, no JWT secret and auth not required: every request is allowed.
+_AUTH_DISABLED = True
+
+# Verified JWTs: blake2b(token) -> (expires_at, claim_persona, scope_ok)
+_JWT_CACHE_TTL_SEC = 30.0
+_JWT_CACHE_MAX = 10_000
+_jwt_cache: OrderedDict[bytes, tuple[float, str, bool]] = OrderedDict()
+_jwt_cache_lock = threading.Lock()
+_jwt_mod: Any = None
+_jwt_missing = False
+
+
+# MemoryManager is shared across the threadpool: L2 opens SQLite with check_same_thread=False
+# behind its own RLock and L1 locks internally, so /goal and /memory/status run concurrently.
+_memory_lock = threading.Lock()
 
 
 def get_memory() -> MemoryManager:
     global _memory
     if _memory is None:
-        _memory = MemoryManager()
+        with _memory_lock:
+            if _memory is None:
+                _memory = MemoryManager()
     return _memory
 
 
+# L1 goal keys: fixed prefix + 16 random hex chars. id(req) was reused once the request
+# object was freed, silently overwriting an earlier goal in the LRU.
+_GOAL_KEY_PREFIX = "goal:"
+
+
+def _remember_goal(key: str, goal: str, persona: str) -> None:
+    """Store a goal in L1/L2 (scrubbed first). Runs in the threadpool."""
+    memory = get_memory()
+    safe_goal = clean_telemetry(goal)
+    memory.l1.put(key, safe_goal)
+    memory.l2.add(safe_goal, tags=f"persona:{persona}")
+
+
 def get_executor() -> ToolExecutor:
     global _executor
     if _executor is None:
-        from cli import _normalize_persona_str
         p = _normalize_persona_str(os.getenv("PHYSICLAW_PERSONA", "sre"))
         _executor = ToolExecutor(persona=Persona(p))
     return _executor
 
 
-def _load_api_key_map() -> dict[str, set[str]]:
+def _parse_api_keys(raw: str) -> dict[str, frozenset[str]]:
     """
-    Parse PHYSICLAW_API_KEYS into { persona: {keys...} }.
+    Parse PHYSICLAW_API_KEYS into { persona: frozenset(keys) }.
     Format: "sre:KEY_SRE,secops:KEY_SECOPS,data_architect:KEY_DATA" or "*:KEY" for any persona.
     """
-    global _API_KEY_MAP
-    if _API_KEY_MAP is not None:
-        return _API_KEY_MAP
-    raw = os.getenv("PHYSICLAW_API_KEYS", "").strip()
     mapping: dict[str, set[str]] = {}
-    if raw:
-        from cli import _normalize_persona_str
-        for part in raw.split(","):
-            part = part.strip()
-            if not part:
-                continue
-            if ":" in part:
-                persona_raw, key = part.split(":", 1)
-                persona = _normalize_persona_str(persona_raw)
-            else:
-                persona = "*"
-                key = part
-            if not key:
-                continue
-            mapping.setdefault(persona, set()).add(key)
-    _API_KEY_MAP = mapping
-    return mapping
+    for part in raw.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if ":" in part:
+            persona_raw, key = part.split(":", 1)
+            persona = _normalize_persona_str(persona_raw)
+        else:
+            persona = "*"
+            key = part
+        if not key:
+            continue
+        mapping.setdefault(persona, set()).add(key)
+    return {persona: frozenset(keys) for persona, keys in mapping.items()}
+
+
+def _load_auth_config() -> None:
+    """
+    Resolve auth env vars into module globals. Runs at import and again at lifespan
+    startup; the request path only reads the cached values.
+    """
+    global _API_KEY_MAP, _MERGED_KEYS_BY_PERSONA, _WILDCARD_KEYS, _AUTH_REQUIRED, _JWT_SECRET
+    global _AUTH_DISABLED
+    _API_KEY_MAP = _parse_api_keys(os.getenv("PHYSICLAW_API_KEYS", "").strip())
+    _WILDCARD_KEYS = _API_KEY_MAP.get("*", frozenset())
+    _MERGED_KEYS_BY_PERSONA = {
+        persona: keys | _WILDCARD_KEYS for persona, keys in _API_KEY_MAP.items() if persona != "*"
+    }
+    v = os.getenv("PHYSICLAW_REQUIRE_AUTH", "").strip().lower()
+    _AUTH_REQUIRED = v in ("1", "true", "yes", "required")
+    _JWT_SECRET = os.getenv("PHYSICLAW_JWT_SECRET", "").strip() or None
+    _AUTH_DISABLED = not _AUTH_REQUIRED and not _JWT_SECRET and not _API_KEY_MAP
+    with _jwt_cache_lock:
+        _jwt_cache.clear()
+
+
+def _load_api_key_map() -> Mapping[str, frozenset[str]]:
+    return _API_KEY_MAP
 
 
 def _auth_required() -> bool:
-    v = os.getenv("PHYSICLAW_REQUIRE_AUTH", "").strip().lower()
-    return v in ("1", "true", "yes", "required")
+    return _AUTH_REQUIRED
+
+
+_load_auth_config()
 
 
-def _validate_jwt(request: Request, persona: str) -> bool:
+def _load_jwt() -> Any:
+    """PyJWT, imported once on first use; None (also remembered) if not installed."""
+    global _jwt_mod, _jwt_missing
+    if _jwt_mod is None and not _jwt_missing:
+        try:
+            import jwt  # type: ignore[import]
+            _jwt_mod = jwt
+        except Exception:
+            _jwt_missing = True
+    return _jwt_mod
+
+
+def _verified_jwt_claims(token: str, secret: str) -> tuple[str, bool] | None:
+    """
+    Verify an HS256 token and return (claim_persona, scope_ok), or None if invalid.
+
+    Verified tokens are cached by blake2b digest (never the raw token) for at most
+    _JWT_CACHE_TTL_SEC and never past their own `exp`, so a UI reusing one token
+    skips the HMAC + JSON decode on every request.
+    """
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    now = time.time()
+    with _jwt_cache_lock:
+        hit = _jwt_cache.get(key)
+        if hit is not None:
+            if hit[0] > now:
+                _jwt_cache.move_to_end(key)
+                return hit[1], hit[2]
+            del _jwt_cache[key]
+
+    jwt = _load_jwt()
+    if jwt is None:
+        return None
+    try:
+        claims = jwt.decode(token, secret, algorithms=["HS256"], options={"verify_aud": False})
+    except Exception:
+        return None
+
+    claim_persona = str((claims.get("persona") or claims.get("role") or "")).strip().lower()
+    scope = claims.get("scope")
+    scope_ok = True
+    if scope:
+        scopes = str(scope).split()
+        scope_ok = "physiclaw:goal" in scopes or "physiclaw:*" in scopes
+
+    expires_at = now + _JWT_CACHE_TTL_SEC
+    exp = claims.get("exp")
+    if isinstance(exp, (int, float)):
+        expires_at = min(expires_at, float(exp))
+    with _jwt_cache_lock:
+        _jwt_cache[key] = (expires_at, claim_persona, scope_ok)
+        if len(_jwt_cache) > _JWT_CACHE_MAX:
+            _jwt_cache.popitem(last=False)
+    return claim_persona, scope_ok
+
+
+def _validate_jwt(headers: Mapping[bytes, bytes], persona: str) -> bool:
     """Optional local JWT auth (HS256, on-prem only).
 
     Enabled when PHYSICLAW_JWT_SECRET is set. Expects:
@@ -95,38 +218,26 @@ def _validate_jwt(request: Request, persona: str) -> bool:
     - Claims: optional `persona` (or `role`) matching requested persona,
       and optional `scope` including `physiclaw:goal` or `physiclaw:*`.
     """
-    secret = os.getenv("PHYSICLAW_JWT_SECRET", "").strip()
+    secret = _JWT_SECRET
     if not secret:
         return False
-    auth = request.headers.get("authorization") or request.headers.get("Authorization")
+    auth = headers.get(b"authorization", b"").decode("latin-1")
     if not auth or not auth.lower().startswith("bearer "):
         return False
     token = auth.split(" ", 1)[1].strip()
     if not token:
         return False
-    try:
-        import jwt  # type: ignore[import]
-    except Exception:
-        return False
-    try:
-        claims = jwt.decode(token, secret, algorithms=["HS256"], options={"verify_aud": False})
-    except Exception:
+    verified = _verified_jwt_claims(token, secret)
+    if verified is None:
         return False
 
-    claim_persona = str((claims.get("persona") or claims.get("role") or "")).strip().lower()
+    claim_persona, scope_ok = verified
     if claim_persona and claim_persona != persona:
         return False
+    return scope_ok
 
-    scope = claims.get("scope")
-    if scope:
-        scopes = str(scope).split()
-        if "physiclaw:goal" not in scopes and "physiclaw:*" not in scopes:
-            return False
-
-    return True
 
-
-def _is_authorized(request: Request, persona: str) -> bool:
+def _is_authorized(headers: Mapping[bytes, bytes], persona: str) -> bool:
     """
     Local-first auth:
     - PHYSICLAW_API_KEYS="sre:KEY_SRE,secops:KEY_SECOPS,data_architect:KEY_DATA"
@@ -135,20 +246,22 @@ def _is_authorized(request: Request, persona: str) -> bool:
     - If PHYSICLAW_REQUIRE_AUTH=1, a valid JWT or API key must be present and mapped.
     - If not required but keys are set, a provided key/JWT must still be valid; missing creds are allowed.
     """
+    if _AUTH_DISABLED:
+        return True
+
     # Prefer JWT if configured and present
-    if _validate_jwt(request, persona):
+    if _validate_jwt(headers, persona):
         return True
 
     keys_map = _load_api_key_map()
-    header_key = request.headers.get("x-physiclaw-key")
+    raw_key = headers.get(b"x-physiclaw-key")
+    header_key = raw_key.decode("latin-1") if raw_key is not None else None
 
     # No keys configured
     if not keys_map:
         return not _auth_required()
 
-    allowed = set()
-    allowed.update(keys_map.get(persona, set()))
-    allowed.update(keys_map.get("*", set()))
+    allowed = _MERGED_KEYS_BY_PERSONA.get(persona, _WILDCARD_KEYS)
 
     if _auth_required():
         if not header_key or header_key not in allowed:
@@ -161,6 +274,124 @@ def _is_authorized(request: Request, persona: str) -> bool:
     return header_key in allowed
 
 
+def _resolve_persona(raw: str | None) -> str:
+    """Requested persona (body field, else PHYSICLAW_PERSONA) normalized to a Persona value."""
+    return _normalize_persona_str((raw or os.getenv("PHYSICLAW_PERSONA", "sre")).strip().lower())
+
+
+def _is_json_content_type(value: bytes | None) -> bool:
+    """Whether FastAPI would parse a body with this Content-Type as JSON (absent counts)."""
+    if not value:
+        return True
+    main, _, sub = value.split(b";", 1)[0].strip().lower().partition(b"/")
+    return main == b"application" and (sub == b"json" or sub.endswith(b"+json"))
+
+
+def _requested_persona(body: bytes, content_type: bytes | None) -> str | None:
+    """
+    Persona a /goal body asks for, or None when the body is not a valid goal payload.
+    Invalid payloads are left to FastAPI/route validation, so a malformed request gets
+    its 422/400 whether or not it carries credentials, as before auth existed. The checks
+    mirror GoalRequest (goal: non-empty str, persona: str | None) and FastAPI's JSON
+    content-type rule; a JSON-looking text/plain or form body is not a goal payload.
+    """
+    if not _is_json_content_type(content_type):
+        return None
+    try:
+        data = orjson.loads(body)
+    except ValueError:
+        return None
+    if not isinstance(data, dict):
+        return None
+    goal = data.get("goal")
+    if not isinstance(goal, str) or not goal:
+        return None
+    raw = data.get("persona")
+    if raw is not None and not isinstance(raw, str):
+        return None
+    persona = _resolve_persona(raw)
+    return persona if persona in _PERSONAS else None
+
+
+class AuthASGIMiddleware:
+    """
+    Pure ASGI auth guard for POST /goal.
+
+    Runs before FastAPI routing, dependency resolution and Pydantic validation; reads
+    credentials straight from scope["headers"] and answers 401/403 without invoking
+    the app. The buffered body is replayed to the app so the route parses it as usual;
+    bodies that would fail validation skip the auth check (see _requested_persona).
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            _AUTH_DISABLED
+            or scope["type"] != "http"
+            or scope["path"] != "/goal"
+            or scope["method"] != "POST"
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        body = await _read_body(receive)
+        headers = dict(scope["headers"])
+        persona = _requested_persona(body, headers.get(b"content-type"))
+        if persona is not None and not _is_authorized(headers, persona):
+            audit_log("auth_denied", persona=persona)
+            # Empty header values count as absent (401), as in the route-level check
+            has_creds = bool(headers.get(b"x-physiclaw-key") or headers.get(b"authorization"))
+            await _send_error(
+                send,
+                403 if has_creds else 401,
+                "invalid or unauthorized credentials for persona",
+            )
+            return
+
+        await self.app(scope, _replay_body(body, receive), send)
+
+
+async def _read_body(receive: Receive) -> bytes:
+    chunks: list[bytes] = []
+    while True:
+        message = await receive()
+        if message["type"] != "http.request":
+            break
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            break
+    return b"".join(chunks)
+
+
+def _replay_body(body: bytes, receive: Receive) -> Receive:
+    replayed = False
+
+    async def replay() -> Message:
+        nonlocal replayed
+        if not replayed:
+            replayed = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        return await receive()
+
+    return replay
+
+
+async def _send_error(send: Send, status: int, detail: str) -> None:
+    """Raw ASGI JSON error in the same shape as FastAPI's HTTPException body."""
+    body = orjson.dumps({"detail": detail})
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
 # --- Request/Response models -------------------------------------------------
 
 class GoalRequest(BaseModel):
@@ -179,20 +410,31 @@ class GoalResponse(BaseModel):
 
 # --- Tool resolution (Python is sole authority) -------------------------------
 
-def resolve_goal_to_tools(goal: str, persona: str) -> list[str]:
+# One immutable, sorted tuple per persona, built once at import.
+_ALLOWED_BY_PERSONA: dict[str, tuple[str, ...]] = {
+    "sre": tuple(sorted(SRE_WHITELIST)),
+    "secops": tuple(sorted(SECOPS_WHITELIST)),
+    "data_architect": tuple(sorted(DATA_ARCHITECT_WHITELIST)),
+}
+
+
+def resolve_goal_to_tools(goal: str, persona: str) -> tuple[str, ...]:
     """
     Map a goal to the subset of tools this persona is allowed to use.
     Node never sends tool names; we derive them from goal + whitelist.
     """
-    from cli import _normalize_persona_str
     p = _normalize_persona_str(persona)
-    if p == "sre":
-        return list(SRE_WHITELIST)
-    if p == "secops":
-        return list(SECOPS_WHITELIST)
-    if p == "data_architect":
-        return list(DATA_ARCHITECT_WHITELIST)
-    return []
+    return _ALLOWED_BY_PERSONA.get(p, ())
+
+
+# Everything in a /goal response except the goal itself is fixed per persona; built once
+# (without re-validation) so the handler only adds the goal and serializes.
+_RESPONSE_TEMPLATES: dict[str, dict[str, Any]] = {
+    p: GoalResponse.model_construct(goal="", persona=p, allowed_tools=list(tools)).model_dump(
+        exclude={"goal"}
+    )
+    for p, tools in _ALLOWED_BY_PERSONA.items()
+}
 
 
 # --- Lifespan -----------------------------------------------------------------
@@ -201,12 +443,13 @@ def resolve_goal_to_tools(goal: str, persona: str) -> list[str]:
 async def lifespan(app: FastAPI):
     import logging
     logging.getLogger(__name__).info("Physiclaw Bridge v%s starting", __version__)
+    _load_auth_config()
     try:
         from security.watchdog import start_egress_watchdog
         start_egress_watchdog(interval_sec=5.0)
     except Exception as e:
         logging.getLogger(__name__).warning("Egress watchdog not started: %s", e)
-    get_memory()
+    await run_in_threadpool(get_memory)
     yield
     # optional: close L2/L3 connections
     global _memory
@@ -220,42 +463,30 @@ app = FastAPI(
     description="Goal-only RPC. Node cannot request tools; Python enforces persona whitelist.",
     version=__version__,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
+app.add_middleware(AuthASGIMiddleware)
 
 
 @app.post("/goal", response_model=GoalResponse)
-async def submit_goal(req: GoalRequest, request: Request) -> GoalResponse:
+async def submit_goal(req: GoalRequest) -> ORJSONResponse:
     """
     Accept a goal only. Tool selection is determined by the backend from persona.
     Returns the list of tools this persona is allowed to use (for display/logging).
+    Credentials are checked earlier by AuthASGIMiddleware.
     """
-    from cli import _normalize_persona_str
-    raw = (req.persona or os.getenv("PHYSICLAW_PERSONA", "sre")).strip().lower()
-    persona = _normalize_persona_str(raw)
-    if persona not in ("sre", "secops", "data_architect"):
+    persona = _resolve_persona(req.persona)
+    if persona not in _PERSONAS:
         raise HTTPException(status_code=400, detail="persona must be 'sre', 'secops', or 'data_architect'")
 
-    if not _is_authorized(request, persona):
-        audit_log("auth_denied", persona=persona)
-        has_api_key = bool(request.headers.get("x-physiclaw-key"))
-        has_jwt = bool(request.headers.get("authorization") or request.headers.get("Authorization"))
-        status = 401 if not (has_api_key or has_jwt) else 403
-        raise HTTPException(status_code=status, detail="invalid or unauthorized credentials for persona")
-
     audit_log("goal", persona=persona, goal_len=len(req.goal))
 
-    # Store goal in memory (scrub telemetry first)
-    memory = get_memory()
-    safe_goal = clean_telemetry(req.goal)
-    memory.l1.put(f"goal:{id(req)}", safe_goal)
-    memory.l2.add(safe_goal, tags=f"persona:{persona}")
+    # Store goal in memory without blocking the event loop on SQLite
+    key = _GOAL_KEY_PREFIX + secrets.token_hex(8)
+    await run_in_threadpool(_remember_goal, key, req.goal, persona)
 
-    allowed = resolve_goal_to_tools(req.goal, persona)
-    return GoalResponse(
-        goal=req.goal,
-        persona=persona,
-        allowed_tools=allowed,
-    )
+    # Same body as GoalResponse; returned directly so FastAPI skips response_model validation
+    return ORJSONResponse({"goal": req.goal, **_RESPONSE_TEMPLATES[persona]})
 
 
 @app.get("/health")
@@ -263,17 +494,49 @@ async def health() -> dict[str, str]:
     return {"status": "ok", "service": "physiclaw-bridge", "version": __version__}
 
 
+# Scrapers (Prometheus, Grafana agent) often hit /metrics in bursts; one build serves them all
+# (not in reset mode, where each build is a delta).
+_METRICS_TTL_SEC = 1.0
+_metrics_cache: tuple[float, bytes] = (float("-inf"), b"")
+
+
 @app.get("/metrics", response_class=PlainTextResponse)
-async def metrics() -> str:
+async def metrics() -> PlainTextResponse:
     """Prometheus text exposition (Phase 2). No egress; scrape locally."""
-    from core.audit import get_prometheus_metrics
-    return get_prometheus_metrics()
+    global _metrics_cache
+    now = time.monotonic()
+    built_at, body = _metrics_cache
+    if metrics_reset_enabled():
+        # Each body is a delta the build consumed; serving it twice would double-count.
+        body = get_prometheus_metrics_bytes()
+    elif now - built_at >= _METRICS_TTL_SEC:
+        # Synchronous build with no await in between: no lock needed on the event loop.
+        body = get_prometheus_metrics_bytes()
+        _metrics_cache = (now, body)
+    return PlainTextResponse(content=body, media_type="text/plain; version=0.0.4")
+
+
+# /memory/status is polled by the UI; reuse the L3 row count for a few seconds.
+_L3_ROWS_TTL_SEC = 5.0
+_l3_rows_cache: tuple[float, int, Any] | None = None  # (monotonic ts, id(table), rows)
+
+
+async def _l3_row_count(tbl: Any) -> Any:
+    """LanceDB count_rows() on the threadpool (it does file I/O), cached per table for a TTL."""
+    global _l3_rows_cache
+    now = time.monotonic()
+    cached = _l3_rows_cache
+    if cached is not None and cached[1] == id(tbl) and now - cached[0] < _L3_ROWS_TTL_SEC:
+        return cached[2]
+    rows = await run_in_threadpool(tbl.count_rows)
+    _l3_rows_cache = (now, id(tbl), rows)
+    return rows
 
 
 @app.get("/memory/status")
 async def memory_status() -> dict[str, Any]:
     """L1/L2/L3 status for UI sidebar (e.g. SQLite connected, LanceDB indexed)."""
-    mem = get_memory()
+    mem = await run_in_threadpool(get_memory)
     out: dict[str, Any] = {
         "l1": "connected",
         "l2": "connected",
@@ -284,7 +547,7 @@ async def memory_status() -> dict[str, Any]:
             # LanceDB: some versions use count_rows() or len(list(to_batches()))
             tbl = getattr(mem.l3, "_table", None)
             if tbl is not None and hasattr(tbl, "count_rows"):
-                out["l3_rows"] = tbl.count_rows()
+                out["l3_rows"] = await _l3_row_count(tbl)
             else:
                 out["l3_rows"] = None
         except Exception:
@@ -298,6 +561,30 @@ if __name__ == "__main__":
     import logging
     import uvicorn
     port = int(os.getenv("PHYSICLAW_BRIDGE_PORT", "8000"))
+    # Counters, L1 cache and the egress watchdog are per process; raise only if that is fine.
+    workers = max(1, int(os.getenv("PHYSICLAW_BRIDGE_WORKERS", "1")))
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+    try:
+        import httptools  # noqa: F401
+        http = "httptools"
+    except ImportError:
+        http = "h11"
     logging.basicConfig(level=logging.INFO)
-    logging.info("Physiclaw Bridge v%s starting on 0.0.0.0:%s", __version__, port)
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    logging.info(
+        "Physiclaw Bridge v%s starting on 0.0.0.0:%s (workers=%s, loop=%s, http=%s)",
+        __version__, port, workers, loop, http,
+    )
+    # Multiple workers need the import string; a single worker reuses this module's app.
+    uvicorn.run(
+        "bridge:app" if workers > 1 else app,
+        host="0.0.0.0",
+        port=port,
+        workers=workers,
+        loop=loop,
+        http=http,
+        access_log=False,
+    )
@@ -8,7 +8,10 @@ from __future__ import annotations
 
 __version__ = "0.1.1-alpha"
 
+import asyncio
+import functools
 import os
+import re
 import shlex
 import subprocess
 from enum import Enum
@@ -20,6 +23,8 @@ _STRIPPED_ENV_PREFIXES = (
     "KUBECONFIG", "KUBE_", "VAULT_", "TOKEN", "PASSWORD", "CREDENTIAL", "PRIVATE_KEY",
     "SLACK_", "DISCORD_", "TELEGRAM_", "POSTHOG", "SENTRY_", "STRIPE_",
 )
+# Substrings that mark any other key as sensitive.
+_SENSITIVE_ENV_RE = re.compile("KEY|SECRET|TOKEN|PASSWORD")
 # Minimal safe env for the restricted subprocess.
 _SAFE_ENV_KEYS = frozenset({"PATH", "HOME", "USER", "LANG", "LC_ALL", "TERM", "PHYSICLAW_PERSONA"})
 
@@ -53,11 +58,42 @@ DATA_ARCHITECT_WHITELIST = frozenset({
     "sqlmesh run",
 })
 
+# Canonical argv prefix for each whitelisted spelling, keyed by its normalized form.
+# Adding a whitelisted tool means adding its entry here as well.
+_TOOL_ARGV: dict[str, tuple[str, ...]] = {
+    "kubectl-get": ("kubectl", "get"),
+    "kubectl get": ("kubectl", "get"),
+    "terraform-plan": ("terraform", "plan"),
+    "terraform plan": ("terraform", "plan"),
+    "log-aggregator": ("log-aggregator",),
+    "prometheus-query": ("prometheus-query",),
+    "nmap": ("nmap",),
+    "bandit-scan": ("bandit",),
+    "bandit": ("bandit",),
+    "iam-inspect": ("iam-inspect",),
+    "vault-read": ("vault-read",),
+    "duckdb": ("duckdb",),
+    "duckdb-query": ("duckdb",),
+    "dbt run": ("dbt", "run"),
+    "dbt test": ("dbt", "test"),
+    "dbt build": ("dbt", "build"),
+    "dbt compile": ("dbt", "compile"),
+    "dbt docs generate": ("dbt", "docs", "generate"),
+    "sqlmesh audit": ("sqlmesh", "audit"),
+    "sqlmesh plan": ("sqlmesh", "plan"),
+    "sqlmesh run": ("sqlmesh", "run"),
+}
+
+_WS_RE = re.compile(r"\s+")
+
+
 # Normalize for lookup: lowercase, single spaces.
+@functools.lru_cache(maxsize=512)
 def _norm(tool: str) -> str:
-    return " ".join(tool.lower().split())
+    return _WS_RE.sub(" ", tool.strip().lower())
 
 
+@functools.lru_cache(maxsize=16)
 def _normalize_persona_str(s: str) -> str:
     """Map 'data' or 'data_architect' to Persona value."""
     s = (s or "").strip().lower()
@@ -84,6 +120,21 @@ class Persona(str, Enum):
     DATA_ARCHITECT = "data_architect"
 
 
+_WHITELISTS: dict[Persona, frozenset[str]] = {
+    Persona.SRE: SRE_WHITELIST,
+    Persona.SECOPS: SECOPS_WHITELIST,
+    Persona.DATA_ARCHITECT: DATA_ARCHITECT_WHITELIST,
+}
+# Normalized once per persona (this also warms the _norm cache): exact hits are a set
+# lookup, "tool is part of an entry" is one scan of the joined entries (_norm never
+# leaves a newline).
+_NORM_WHITELISTS: dict[Persona, tuple[frozenset[str], str]] = {}
+for _persona, _whitelist in _WHITELISTS.items():
+    _normed = frozenset(_norm(t) for t in _whitelist)
+    _NORM_WHITELISTS[_persona] = (_normed, "\n".join(_normed))
+del _persona, _whitelist, _normed
+
+
 class ToolExecutor:
     """
     Executes tools only if they are on the persona whitelist.
@@ -91,19 +142,18 @@ class ToolExecutor:
     """
 
     def __init__(self, persona: Persona | str = Persona.SRE):
-        if isinstance(persona, str):
-            persona = Persona(_normalize_persona_str(persona))
-        self.persona = persona
-        if persona == Persona.SRE:
-            self._whitelist = SRE_WHITELIST
-        elif persona == Persona.SECOPS:
-            self._whitelist = SECOPS_WHITELIST
-        else:
-            self._whitelist = DATA_ARCHITECT_WHITELIST
+        self.persona = persona if isinstance(persona, Persona) else Persona(_normalize_persona_str(persona))
+        self._whitelist = _WHITELISTS[self.persona]
+        self._norm_set, self._norm_joined = _NORM_WHITELISTS[self.persona]
+        self._env_cache: tuple[int, dict[str, str]] | None = None
 
     def allowed(self, tool: str) -> bool:
         n = _norm(tool)
-        return any(n == _norm(t) or n in _norm(t) or _norm(t) in n for t in self._whitelist)
+        return (
+            n in self._norm_set
+            or n in self._norm_joined
+            or any(t in n for t in self._norm_set if len(t) <= len(n))
+        )
 
     def execute(self, tool: str, *args: Any, **kwargs: Any) -> dict[str, Any]:
         """
@@ -111,14 +161,33 @@ class ToolExecutor:
         Executes in a restricted subprocess with a clean environment (no sensitive ENV).
         Returns a result dict or raises SecurityViolation.
         """
-        if not self.allowed(tool):
-            try:
-                from core.audit import audit_log
-                audit_log("security_violation", persona=self.persona.value, tool=tool)
-            except Exception:
-                pass
-            raise SecurityViolation(tool, self.persona.value)
+        self._ensure_allowed(tool)
         result = self._run_isolated(tool, *args, **kwargs)
+        self._audit_tool_call(tool, result)
+        return result
+
+    async def execute_async(self, tool: str, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        """
+        Async variant of execute() for event-loop callers (same whitelist, env and result
+        shape). The tool runs as an asyncio subprocess, so a long `terraform plan` does not
+        block the loop or tie up a worker thread.
+        """
+        self._ensure_allowed(tool)
+        result = await self._run_isolated_async(tool, *args, **kwargs)
+        self._audit_tool_call(tool, result)
+        return result
+
+    def _ensure_allowed(self, tool: str) -> None:
+        if self.allowed(tool):
+            return
+        try:
+            from core.audit import audit_log
+            audit_log("security_violation", persona=self.persona.value, tool=tool)
+        except Exception:
+            pass
+        raise SecurityViolation(tool, self.persona.value)
+
+    def _audit_tool_call(self, tool: str, result: dict[str, Any]) -> None:
         try:
             from core.audit import audit_log
             audit_log(
@@ -129,32 +198,43 @@ class ToolExecutor:
             )
         except Exception:
             pass
-        return result
+
+    def invalidate_env(self) -> None:
+        """Drop the cached subprocess env (e.g. after changing an existing os.environ value)."""
+        self._env_cache = None
 
     def _clean_env(self) -> dict[str, str]:
-        """Build minimal env for subprocess: only safe keys, no secrets."""
+        """
+        Build minimal env for subprocess: only safe keys, no secrets. One pass over os.environ.
+        Cached per executor and rebuilt when the number of env vars changes; call
+        invalidate_env() after replacing a value in place.
+        """
+        env_len = len(os.environ)
+        cached = self._env_cache
+        if cached is not None and cached[0] == env_len:
+            return dict(cached[1])
         out: dict[str, str] = {}
-        for key in _SAFE_ENV_KEYS:
-            val = os.environ.get(key)
-            if val is not None:
-                out[key] = val
-        # Strip any key that looks like secrets
         for k, v in os.environ.items():
-            if k in out:
+            if k in _SAFE_ENV_KEYS:
+                out[k] = v
                 continue
+            # Strip any key that looks like secrets
             up = k.upper()
-            if any(up.startswith(p) for p in _STRIPPED_ENV_PREFIXES):
-                continue
-            if "KEY" in up or "SECRET" in up or "TOKEN" in up or "PASSWORD" in up:
+            if up.startswith(_STRIPPED_ENV_PREFIXES) or _SENSITIVE_ENV_RE.search(up):
                 continue
             out[k] = v
         out["PHYSICLAW_PERSONA"] = self.persona.value
-        return out
+        self._env_cache = (env_len, out)
+        return dict(out)
 
     def _tool_to_argv(self, tool: str, *args: Any) -> list[str]:
         """Map whitelisted tool name to command argv. Prefer explicit binary + args."""
         n = _norm(tool)
-        # Map known tools to [binary, ...args]
+        base = _TOOL_ARGV.get(n)
+        if base is not None:
+            return [*base, *(str(a) for a in args)]
+        # Other spellings the whitelist accepted (e.g. "kubectl get pods"): pin the binary
+        # by keyword so only the whitelisted command can run.
         if "kubectl" in n and "get" in n:
             return ["kubectl", "get"] + [str(a) for a in args]
         if "terraform" in n and "plan" in n:
@@ -175,28 +255,38 @@ class ToolExecutor:
         # Fallback: treat tool as a single command, args appended
         return shlex.split(tool) + [str(a) for a in args]
 
-    def _run_isolated(self, tool: str, *args: Any, **kwargs: Any) -> dict[str, Any]:
-        """Run whitelisted tool in restricted subprocess or hardened bwrap sandbox (Phase 1)."""
-        argv = self._tool_to_argv(tool, *args)
-        if not argv:
-            return {"ok": False, "error": "empty command", "stdout": "", "stderr": ""}
+    def _run_settings(self, kwargs: dict[str, Any]) -> tuple[dict[str, str], float | int, str]:
+        """Subprocess env, timeout and cwd shared by the sync and async runners."""
         env = self._clean_env()
         timeout_sec = kwargs.get("timeout") if isinstance(kwargs.get("timeout"), (int, float)) else 300
         cwd = os.environ.get("PHYSICLAW_CWD") or os.getcwd()
+        return env, timeout_sec, cwd
 
-        # Phase 1: hardened sandbox when PHYSICLAW_SANDBOX=1 and bwrap is available
+    @staticmethod
+    def _use_bwrap() -> bool:
+        """Phase 1: hardened sandbox when PHYSICLAW_SANDBOX=1 and bwrap is available."""
         try:
-            from security.sandbox import bwrap_available, run_in_bwrap, sandbox_allow_network, sandbox_enabled
-            if sandbox_enabled() and bwrap_available():
-                return run_in_bwrap(
-                    argv,
-                    env=env,
-                    cwd=cwd,
-                    timeout_sec=timeout_sec,
-                    allow_network=sandbox_allow_network(),
-                )
+            from security.sandbox import bwrap_available, sandbox_enabled
         except ImportError:
-            pass
+            return False
+        return sandbox_enabled() and bwrap_available()
+
+    def _run_isolated(self, tool: str, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        """Run whitelisted tool in restricted subprocess or hardened bwrap sandbox (Phase 1)."""
+        argv = self._tool_to_argv(tool, *args)
+        if not argv:
+            return {"ok": False, "error": "empty command", "stdout": "", "stderr": ""}
+        env, timeout_sec, cwd = self._run_settings(kwargs)
+
+        if self._use_bwrap():
+            from security.sandbox import run_in_bwrap, sandbox_allow_network
+            return run_in_bwrap(
+                argv,
+                env=env,
+                cwd=cwd,
+                timeout_sec=timeout_sec,
+                allow_network=sandbox_allow_network(),
+            )
 
         # Fallback: clean-env subprocess (no bwrap)
         try:
@@ -204,15 +294,14 @@ class ToolExecutor:
                 argv,
                 env=env,
                 capture_output=True,
-                text=True,
                 timeout=timeout_sec,
                 cwd=cwd,
             )
             return {
                 "ok": result.returncode == 0,
                 "returncode": result.returncode,
-                "stdout": result.stdout or "",
-                "stderr": result.stderr or "",
+                "stdout": result.stdout.decode("utf-8", "replace"),
+                "stderr": result.stderr.decode("utf-8", "replace"),
             }
         except FileNotFoundError as e:
             return {"ok": False, "error": f"binary not found: {argv[0]}", "stdout": "", "stderr": str(e)}
@@ -221,6 +310,61 @@ class ToolExecutor:
         except Exception as e:
             return {"ok": False, "error": str(e), "stdout": "", "stderr": ""}
 
+    async def _run_isolated_async(self, tool: str, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        """_run_isolated with an asyncio subprocess; the bwrap path runs on a worker thread."""
+        argv = self._tool_to_argv(tool, *args)
+        if not argv:
+            return {"ok": False, "error": "empty command", "stdout": "", "stderr": ""}
+        env, timeout_sec, cwd = self._run_settings(kwargs)
+
+        if self._use_bwrap():
+            from security.sandbox import run_in_bwrap, sandbox_allow_network
+            return await asyncio.to_thread(
+                run_in_bwrap,
+                argv,
+                env=env,
+                cwd=cwd,
+                timeout_sec=timeout_sec,
+                allow_network=sandbox_allow_network(),
+            )
+
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *argv,
+                env=env,
+                cwd=cwd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except FileNotFoundError as e:
+            return {"ok": False, "error": f"binary not found: {argv[0]}", "stdout": "", "stderr": str(e)}
+        except Exception as e:
+            return {"ok": False, "error": str(e), "stdout": "", "stderr": ""}
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout_sec)
+        except asyncio.TimeoutError:
+            try:
+                proc.kill()
+            except ProcessLookupError:
+                pass  # exited between the timeout and the kill
+            await proc.wait()
+            return {"ok": False, "error": "command timed out", "stdout": "", "stderr": ""}
+        except asyncio.CancelledError:
+            try:
+                proc.kill()
+            except ProcessLookupError:
+                pass
+            finally:
+                # Reap it even though this task is cancelled, or it lingers as a zombie.
+                await asyncio.shield(proc.wait())
+            raise
+        return {
+            "ok": proc.returncode == 0,
+            "returncode": proc.returncode,
+            "stdout": stdout.decode("utf-8", "replace"),
+            "stderr": stderr.decode("utf-8", "replace"),
+        }
+
 
 def get_executor(persona: str | None = None) -> ToolExecutor:
     p = _normalize_persona_str(persona or os.getenv("PHYSICLAW_PERSONA", "sre"))
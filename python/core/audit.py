@@ -7,14 +7,28 @@ In-memory counters for Prometheus scraping; no egress, no cloud.
 
 from __future__ import annotations
 
+import atexit
 import json
 import logging
 import os
+import queue
 import threading
+import time
+import weakref
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 logger = logging.getLogger(__name__)
 
 # Reuse same base dir as memory so audit lives under .physiclaw
@@ -22,71 +36,416 @@ def _base_dir() -> Path:
     return Path(os.getenv("PHYSICLAW_MEMORY_DIR", ".physiclaw")).expanduser()
 
 
+# (PHYSICLAW_MEMORY_DIR value, audit path); the directory is created once per base dir
+_audit_path_cache: tuple[str | None, Path] | None = None
+
+
 def _audit_path() -> Path:
+    global _audit_path_cache
+    raw = os.getenv("PHYSICLAW_MEMORY_DIR")
+    cached = _audit_path_cache
+    if cached is not None and cached[0] == raw:
+        return cached[1]
     p = _base_dir() / "audit.jsonl"
     p.parent.mkdir(parents=True, exist_ok=True)
+    _audit_path_cache = (raw, p)
     return p
 
 
-_lock = threading.Lock()
-_counters: dict[str, dict[tuple[str, ...], int]] = {
-    "goals_total": {},
-    "tool_calls_total": {},
-    "security_violations_total": {},
-    "egress_blocks_total": {},
-    "auth_denied_total": {},
-}
+_OPEN_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_CLOEXEC", 0)
+
+
+def _open_append(path: Path) -> int:
+    try:
+        return os.open(path, _OPEN_FLAGS, 0o600)
+    except FileNotFoundError:
+        # Directory removed since it was cached (e.g. wipe); recreate and retry once.
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return os.open(path, _OPEN_FLAGS, 0o600)
+
+
+def _write_all(fd: int, chunks: list[bytes], sync: bool) -> int:
+    written = os.writev(fd, chunks)
+    total = sum(len(c) for c in chunks)
+    if written < total:
+        rest = memoryview(b"".join(chunks))[written:]
+        while rest:
+            rest = rest[os.write(fd, rest):]
+    if sync:
+        os.fdatasync(fd)
+    return total
+
+
+# The writer thread keeps one append fd open and checks it only every _AUDIT_CHECK_LINES
+# lines, _AUDIT_CHECK_BYTES or _AUDIT_CHECK_SEC. If the path no longer names the fd's file
+# (another worker process rotated it, or a wipe removed it), the path is reopened without
+# rotating. Otherwise a file past PHYSICLAW_AUDIT_MAX_BYTES is renamed to audit.jsonl.N
+# and a fresh one opened.
+_AUDIT_DEFAULT_MAX_BYTES = 64 << 20
+
+
+def _audit_max_bytes() -> int:
+    """
+    PHYSICLAW_AUDIT_MAX_BYTES as a byte count: unset means 64 MiB, 0 or an empty value
+    disables rotation. Anything else that is not a non-negative integer (e.g. "1M") logs a
+    warning and falls back to the default instead of failing the import.
+    """
+    raw = os.getenv("PHYSICLAW_AUDIT_MAX_BYTES")
+    if raw is None:
+        return _AUDIT_DEFAULT_MAX_BYTES
+    raw = raw.strip()
+    if not raw:
+        return 0
+    try:
+        value = int(raw)
+    except ValueError:
+        value = -1
+    if value < 0:
+        logger.warning(
+            "PHYSICLAW_AUDIT_MAX_BYTES=%r is not a byte count; using %d", raw, _AUDIT_DEFAULT_MAX_BYTES
+        )
+        return _AUDIT_DEFAULT_MAX_BYTES
+    return value
+
+
+_AUDIT_MAX_BYTES = _audit_max_bytes()
+_AUDIT_CHECK_LINES = 1000
+_AUDIT_CHECK_BYTES = 1 << 20
+_AUDIT_CHECK_SEC = 1.0
+_AUDIT_FD: int | None = None
+_AUDIT_FD_PATH: Path | None = None
+_AUDIT_LINES = 0  # since the last check
+_AUDIT_BYTES = 0
+_AUDIT_CHECKED_AT = 0.0
+
+
+def _close_audit_fd() -> None:
+    global _AUDIT_FD, _AUDIT_FD_PATH
+    fd, _AUDIT_FD, _AUDIT_FD_PATH = _AUDIT_FD, None, None
+    if fd is not None:
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+
+
+def _same_file(path: Path, fst: os.stat_result) -> os.stat_result | None:
+    """stat of path if it still names the file fst describes, else None (rotated/removed)."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st if (st.st_dev, st.st_ino) == (fst.st_dev, fst.st_ino) else None
+
+
+def _rotate(path: Path, fst: os.stat_result) -> None:
+    """
+    Rename path to the next free path.N if it is still the file fst describes. Worker
+    processes serialize on an flock of path.lock, so only one of them rotates a given
+    file and an earlier rotation is never overwritten.
+    """
+    lock_fd = os.open(path.with_name(path.name + ".lock"), _OPEN_FLAGS, 0o600)
+    try:
+        if fcntl is not None:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX)  # released by close
+        if _same_file(path, fst) is None:
+            return  # another worker rotated it first
+        prefix = path.name + "."
+        taken = [
+            int(e.name[len(prefix):])
+            for e in os.scandir(path.parent)
+            if e.name.startswith(prefix) and e.name[len(prefix):].isdigit()
+        ]
+        os.rename(path, path.with_name(f"{prefix}{max(taken, default=0) + 1}"))
+        logger.info("Audit log rotated (%s)", path)
+    finally:
+        os.close(lock_fd)
+
+
+def _audit_fd(path: Path) -> int:
+    global _AUDIT_FD, _AUDIT_FD_PATH, _AUDIT_LINES, _AUDIT_BYTES, _AUDIT_CHECKED_AT
+    fd = _AUDIT_FD
+    now = time.monotonic()
+    if fd is not None and _AUDIT_FD_PATH == path:
+        if (
+            _AUDIT_LINES < _AUDIT_CHECK_LINES
+            and _AUDIT_BYTES < _AUDIT_CHECK_BYTES
+            and now - _AUDIT_CHECKED_AT < _AUDIT_CHECK_SEC
+        ):
+            return fd
+        _AUDIT_LINES = _AUDIT_BYTES = 0
+        _AUDIT_CHECKED_AT = now
+        fst = os.fstat(fd)
+        st = _same_file(path, fst)
+        if st is not None and not (_AUDIT_MAX_BYTES and st.st_size >= _AUDIT_MAX_BYTES):
+            return fd
+        _close_audit_fd()
+        if st is not None:
+            _rotate(path, fst)
+    else:
+        _close_audit_fd()  # base dir changed
+    fd = _open_append(path)
+    _AUDIT_FD, _AUDIT_FD_PATH, _AUDIT_CHECKED_AT = fd, path, now
+    return fd
+
+
+def _append(path: Path, chunks: list[bytes], sync: bool = False) -> None:
+    """Append whole lines with one writev() on an O_APPEND fd (cached; writer thread only)."""
+    global _AUDIT_LINES, _AUDIT_BYTES
+    try:
+        cached = _audit_fd(path)
+    except OSError as e:
+        logger.debug("Audit fd cache unusable, opening per write: %s", e)
+        _close_audit_fd()
+    else:
+        try:
+            _AUDIT_BYTES += _write_all(cached, chunks, sync)
+        except OSError:
+            _close_audit_fd()  # reopened on the next batch
+            raise
+        _AUDIT_LINES += len(chunks)
+        return
+    fd = _open_append(path)
+    try:
+        _write_all(fd, chunks, sync)
+    finally:
+        os.close(fd)
+
+
+# Background writer: audit_log enqueues (path, line) and returns; one thread batches the
+# appends. A threading.Event in the queue is a flush barrier (set once everything before it
+# is on disk); a _CloseBarrier also closes the cached fd before it is set.
+_AUDIT_BATCH_MAX = 64
+_AUDIT_BATCH_WAIT_SEC = 0.005
+_writer_q: queue.SimpleQueue[tuple[Path, bytes] | threading.Event] = queue.SimpleQueue()
+_writer_thread: threading.Thread | None = None
+_writer_start_lock = threading.Lock()
+
+
+class _CloseBarrier(threading.Event):
+    pass
+
+
+def _write_batch(batch: list[tuple[Path, bytes]], sync: bool = False) -> None:
+    # Group consecutive lines for the same file (normally all of them) into one writev.
+    i = 0
+    while i < len(batch):
+        path = batch[i][0]
+        j = i
+        while j < len(batch) and batch[j][0] == path:
+            j += 1
+        try:
+            _append(path, [line for _, line in batch[i:j]], sync=sync and j == len(batch))
+        except OSError as e:
+            logger.warning("Audit write failed: %s", e)
+        i = j
+
+
+def _audit_writer_loop() -> None:
+    while True:
+        item = _writer_q.get()
+        batch: list[tuple[Path, bytes]] = []
+        barrier: threading.Event | None = None
+        deadline = time.monotonic() + _AUDIT_BATCH_WAIT_SEC
+        while True:
+            if isinstance(item, threading.Event):
+                barrier = item
+                break
+            batch.append(item)
+            if len(batch) >= _AUDIT_BATCH_MAX:
+                break
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                item = _writer_q.get(timeout=timeout)
+            except queue.Empty:
+                break
+        if batch:
+            _write_batch(batch, sync=barrier is not None)
+        if barrier is not None:
+            if isinstance(barrier, _CloseBarrier):
+                _close_audit_fd()
+            barrier.set()
+
+
+def _ensure_writer() -> None:
+    global _writer_thread
+    if _writer_thread is not None:
+        return
+    with _writer_start_lock:
+        if _writer_thread is None:
+            t = threading.Thread(target=_audit_writer_loop, name="physiclaw-audit-writer", daemon=True)
+            t.start()
+            _writer_thread = t
+
+
+def _reset_writer_after_fork() -> None:
+    # The writer thread does not survive fork; the child starts its own on first use.
+    global _writer_q, _writer_thread, _writer_start_lock
+    _writer_q = queue.SimpleQueue()
+    _writer_thread = None
+    _writer_start_lock = threading.Lock()
+    _close_audit_fd()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_writer_after_fork)
+
+
+def flush_audit(timeout: float = 2.0) -> bool:
+    """Block until queued audit records are written and synced. Returns False on timeout."""
+    if _writer_thread is None:
+        return True
+    done = threading.Event()
+    _writer_q.put(done)
+    return done.wait(timeout)
+
+
+def release_audit_fd(timeout: float = 2.0) -> bool:
+    """
+    Flush like flush_audit, then close the cached fd on the writer thread, so nothing
+    keeps appending to a file whose directory is about to be moved (wipe). The next
+    record reopens audit.jsonl at its path. Returns False on timeout.
+    """
+    if _writer_thread is None:
+        _close_audit_fd()
+        return True
+    done = _CloseBarrier()
+    _writer_q.put(done)
+    return done.wait(timeout)
+
+
+# atexit runs in reverse order: flush the queue first, then close the cached fd.
+atexit.register(_close_audit_fd)
+atexit.register(flush_audit)
+
+
+_COUNTERS = (
+    "goals_total",
+    "tool_calls_total",
+    "security_violations_total",
+    "egress_blocks_total",
+    "auth_denied_total",
+)
+
+_Counters = dict[str, dict[tuple[str, ...], int]]
+
+# Sloppy counters: each thread bumps its own dicts without a lock; scrapes sum them.
+# Threads that have exited are folded into _retired_counters at the next snapshot, so
+# threadpool turnover does not grow the registry.
+_local = threading.local()
+_thread_counters: list[tuple[weakref.ref[threading.Thread], _Counters]] = []
+_retired_counters: _Counters = {name: {} for name in _COUNTERS}
+_registry_lock = threading.Lock()
 
 # Summary stats for latency: key -> label_key -> {sum, count}
+_summary_lock = threading.Lock()
 _summary_stats: dict[str, dict[tuple[str, ...], dict[str, float]]] = {
     "memory_retrieval_seconds": {},
 }
 
 
-def _counter_key(labels: dict[str, str]) -> tuple[str, ...]:
-    return tuple(sorted(labels.items()))
+def _local_counters() -> dict[str, dict[tuple[str, ...], int]]:
+    try:
+        return _local.counters
+    except AttributeError:
+        counters: dict[str, dict[tuple[str, ...], int]] = {name: {} for name in _COUNTERS}
+        with _registry_lock:
+            _thread_counters.append((weakref.ref(threading.current_thread()), counters))
+        _local.counters = counters
+        return counters
+
+
+def _inc(counter: str, key: tuple[tuple[str, str], ...], value: int = 1) -> None:
+    """key is the label tuple sorted by label name, e.g. (("persona", "sre"),)."""
+    values = _local_counters()[counter]
+    values[key] = values.get(key, 0) + value
 
 
-def _inc(counter: str, labels: dict[str, str], value: int = 1) -> None:
-    with _lock:
-        key = _counter_key(labels)
-        _counters[counter][key] = _counters[counter].get(key, 0) + value
+def _snapshot_counters(reset: bool = False) -> dict[str, dict[tuple[str, ...], int]]:
+    """
+    Sum every thread's counters. dict.copy() is atomic under the GIL, so writers never block.
+    With reset, each thread's dicts are swapped for empty ones (best effort: an increment
+    racing the swap can be dropped). Dead threads' dicts are merged into _retired_counters
+    and dropped from the registry; nothing writes them any more, so the merge is exact.
+    """
+    with _registry_lock:
+        live = []
+        for ref, counters in _thread_counters:
+            t = ref()
+            if t is not None and t.is_alive():
+                live.append((ref, counters))
+                continue
+            for name in _COUNTERS:
+                retired = _retired_counters[name]
+                for key, value in counters[name].items():
+                    retired[key] = retired.get(key, 0) + value
+        _thread_counters[:] = live
+        totals = {name: dict(_retired_counters[name]) for name in _COUNTERS}
+        if reset:
+            for retired in _retired_counters.values():
+                retired.clear()
+    for _, counters in live:
+        for name in _COUNTERS:
+            values = counters[name]
+            if reset:
+                counters[name] = {}
+            total = totals[name]
+            for key, value in values.copy().items():
+                total[key] = total.get(key, 0) + value
+    return totals
+
+
+def _encode_record(record: dict[str, Any]) -> bytes:
+    """One JSONL line; ts is rendered as RFC 3339 UTC ("...Z")."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(record, default=str, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_UTC_Z)
+        except orjson.JSONEncodeError:
+            pass  # e.g. ints beyond 64 bits; the stdlib encoder handles those
+    record = {**record, "ts": record["ts"].isoformat().replace("+00:00", "Z")}
+    return (json.dumps(record, default=str) + "\n").encode("utf-8")
 
 
 def audit_log(event: str, **payload: Any) -> None:
     """
     Append one immutable audit record (append-only JSONL). Also bumps in-memory counters
-    for Prometheus. Safe to call from any thread.
+    for Prometheus. Safe to call from any thread; the write happens on the audit writer
+    thread (see flush_audit).
     """
-    ts = datetime.now(UTC).isoformat() + "Z"
-    record = {"ts": ts, "event": event, **{k: v for k, v in payload.items() if v is not None}}
-    line = json.dumps(record, default=str) + "\n"
-    path = _audit_path()
+    record = {
+        "ts": datetime.now(UTC),
+        "event": event,
+        **{k: v for k, v in payload.items() if v is not None},
+    }
+    data = _encode_record(record)
     try:
-        with _lock:
-            with open(path, "a", encoding="utf-8") as f:
-                f.write(line)
+        path = _audit_path()
     except OSError as e:
         logger.warning("Audit write failed: %s", e)
+    else:
+        _ensure_writer()
+        _writer_q.put((path, data))
 
-    # Update counters for Prometheus
+    # Update counters for Prometheus (label tuples already in sorted label-name order)
     if event == "goal":
-        _inc("goals_total", {"persona": str(payload.get("persona", "unknown"))})
+        _inc("goals_total", (("persona", str(payload.get("persona", "unknown"))),))
     elif event == "tool_call":
         _inc(
             "tool_calls_total",
-            {
-                "persona": str(payload.get("persona", "unknown")),
-                "tool": str(payload.get("tool", "unknown"))[:64],
-                "outcome": str(payload.get("outcome", "unknown")),
-            },
+            (
+                ("outcome", str(payload.get("outcome", "unknown"))),
+                ("persona", str(payload.get("persona", "unknown"))),
+                ("tool", str(payload.get("tool", "unknown"))[:64]),
+            ),
         )
     elif event == "security_violation":
-        _inc("security_violations_total", {"persona": str(payload.get("persona", "unknown"))})
+        _inc("security_violations_total", (("persona", str(payload.get("persona", "unknown"))),))
     elif event == "egress_block":
-        _inc("egress_blocks_total", {})
+        _inc("egress_blocks_total", ())
     elif event == "auth_denied":
-        _inc("auth_denied_total", {"persona": str(payload.get("persona", "unknown"))})
+        _inc("auth_denied_total", (("persona", str(payload.get("persona", "unknown"))),))
 
 
 def record_memory_retrieval_seconds(layer: str, seconds: float) -> None:
@@ -96,8 +455,8 @@ def record_memory_retrieval_seconds(layer: str, seconds: float) -> None:
     """
     if not (layer and seconds >= 0):
         return
-    key = _counter_key({"layer": layer})
-    with _lock:
+    key = (("layer", layer),)
+    with _summary_lock:
         entry = _summary_stats["memory_retrieval_seconds"].get(key, {"sum": 0.0, "count": 0.0})
         _summary_stats["memory_retrieval_seconds"][key] = {
             "sum": entry["sum"] + seconds,
@@ -109,60 +468,74 @@ def _escape_label(v: str) -> str:
     return v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
 
 
+# PHYSICLAW_METRICS_RESET=1: counters restart from zero after every scrape, so label sets
+# that stop appearing do not pile up (scrapers must treat the series as deltas). Each
+# delta is handed out once, so this supports a single scraper.
+_METRICS_RESET = os.getenv("PHYSICLAW_METRICS_RESET", "").strip().lower() in ("1", "true", "yes")
+
+
+def metrics_reset_enabled() -> bool:
+    """True when every scrape consumes its delta (PHYSICLAW_METRICS_RESET); do not cache it."""
+    return _METRICS_RESET
+
+# Rendered '{k="v",...}' per label tuple; label sets are stable across scrapes.
+_LABEL_FRAGMENTS_MAX = 10_000
+_label_fragments: dict[tuple[tuple[str, str], ...], bytes] = {}
+
+
+def _label_fragment(key: tuple[tuple[str, str], ...]) -> bytes:
+    frag = _label_fragments.get(key)
+    if frag is None:
+        labels = ",".join(f'{k}="{_escape_label(str(v))}"' for k, v in key)
+        frag = f"{{{labels}}}".encode()
+        if len(_label_fragments) >= _LABEL_FRAGMENTS_MAX:
+            _label_fragments.clear()
+        _label_fragments[key] = frag
+    return frag
+
+
+# (counter, exposition name, HELP text) in output order
+_COUNTER_SERIES = (
+    ("goals_total", b"physiclaw_goals_total", b"Goals submitted by persona."),
+    ("tool_calls_total", b"physiclaw_tool_calls_total", b"Tool executions by persona, tool, outcome."),
+    ("security_violations_total", b"physiclaw_security_violations_total", b"Denied tool calls by persona."),
+    ("egress_blocks_total", b"physiclaw_egress_blocks_total", b"Egress watchdog blocks (non-safe IP)."),
+    ("auth_denied_total", b"physiclaw_auth_denied_total",
+     b"Auth failures (missing or invalid API key) by persona."),
+)
+
+
+def get_prometheus_metrics_bytes() -> bytes:
+    """Prometheus text exposition as UTF-8 bytes, written into one buffer."""
+    counters = _snapshot_counters(reset=_METRICS_RESET)
+    with _summary_lock:
+        retrieval = _summary_stats["memory_retrieval_seconds"]
+        if _METRICS_RESET:
+            _summary_stats["memory_retrieval_seconds"] = {}
+        else:
+            retrieval = dict(retrieval)
+
+    buf = bytearray()
+    for counter, name, help_text in _COUNTER_SERIES:
+        buf += b"# HELP " + name + b" " + help_text + b"\n# TYPE " + name + b" counter\n"
+        if counter == "egress_blocks_total":
+            buf += b"%s %d\n" % (name, sum(counters[counter].values()))
+        else:
+            for key, value in counters[counter].items():
+                buf += b"%s%s %d\n" % (name, _label_fragment(key), value)
+        buf += b"\n"
+
+    buf += (
+        b"# HELP physiclaw_memory_retrieval_seconds Memory retrieval latency (L2/L3/combined) in seconds.\n"
+        b"# TYPE physiclaw_memory_retrieval_seconds summary\n"
+    )
+    for key, entry in retrieval.items():
+        frag = _label_fragment(key)
+        buf += b"physiclaw_memory_retrieval_seconds_sum%s %.6f\n" % (frag, entry["sum"])
+        buf += b"physiclaw_memory_retrieval_seconds_count%s %d\n" % (frag, int(entry["count"]))
+    return bytes(buf)
+
+
 def get_prometheus_metrics() -> str:
     """Return metrics in Prometheus text exposition format (no dependency on prometheus_client)."""
-    lines = [
-        "# HELP physiclaw_goals_total Goals submitted by persona.",
-        "# TYPE physiclaw_goals_total counter",
-    ]
-    with _lock:
-        for key, value in _counters["goals_total"].items():
-            labels = ",".join(f'{k}="{_escape_label(str(v))}"' for k, v in key)
-            lines.append(f"physiclaw_goals_total{{{labels}}} {value}")
-
-        lines.extend([
-            "",
-            "# HELP physiclaw_tool_calls_total Tool executions by persona, tool, outcome.",
-            "# TYPE physiclaw_tool_calls_total counter",
-        ])
-        for key, value in _counters["tool_calls_total"].items():
-            labels = ",".join(f'{k}="{_escape_label(str(v))}"' for k, v in key)
-            lines.append(f"physiclaw_tool_calls_total{{{labels}}} {value}")
-
-        lines.extend([
-            "",
-            "# HELP physiclaw_security_violations_total Denied tool calls by persona.",
-            "# TYPE physiclaw_security_violations_total counter",
-        ])
-        for key, value in _counters["security_violations_total"].items():
-            labels = ",".join(f'{k}="{_escape_label(str(v))}"' for k, v in key)
-            lines.append(f"physiclaw_security_violations_total{{{labels}}} {value}")
-
-        lines.extend([
-            "",
-            "# HELP physiclaw_egress_blocks_total Egress watchdog blocks (non-safe IP).",
-            "# TYPE physiclaw_egress_blocks_total counter",
-        ])
-        total_egress = sum(_counters["egress_blocks_total"].values())
-        lines.append(f"physiclaw_egress_blocks_total {total_egress}")
-
-        lines.extend([
-            "",
-            "# HELP physiclaw_auth_denied_total Auth failures (missing or invalid API key) by persona.",
-            "# TYPE physiclaw_auth_denied_total counter",
-        ])
-        for key, value in _counters["auth_denied_total"].items():
-            labels = ",".join(f'{k}="{_escape_label(str(v))}"' for k, v in key)
-            lines.append(f"physiclaw_auth_denied_total{{{labels}}} {value}")
-
-        lines.extend([
-            "",
-            "# HELP physiclaw_memory_retrieval_seconds Memory retrieval latency (L2/L3/combined) in seconds.",
-            "# TYPE physiclaw_memory_retrieval_seconds summary",
-        ])
-        for key, entry in _summary_stats["memory_retrieval_seconds"].items():
-            labels = ",".join(f'{k}="{_escape_label(str(v))}"' for k, v in key)
-            lines.append(f"physiclaw_memory_retrieval_seconds_sum{{{labels}}} {entry['sum']:.6f}")
-            lines.append(f"physiclaw_memory_retrieval_seconds_count{{{labels}}} {int(entry['count'])}")
-
-    return "\n".join(lines) + "\n"
+    return get_prometheus_metrics_bytes().decode()
@@ -1,10 +1,12 @@
-from .manager import MemoryManager, clean_telemetry
-from .engine import MemoryEngine, embed_text, rerank_query_docs
+from .manager import MemoryManager, clean_telemetry, clear_l1_cache
+from .engine import MemoryEngine, embed_text, embed_texts, rerank_query_docs
 
 __all__ = [
     "MemoryManager",
     "MemoryEngine",
     "clean_telemetry",
+    "clear_l1_cache",
     "embed_text",
+    "embed_texts",
     "rerank_query_docs",
 ]
@@ -7,23 +7,54 @@ Proves the agent can "remember" infrastructure details without calling a cloud v
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import os
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 from .manager import (
     BASE_DIR,
     L2_PATH,
     L3_PATH,
+    VECTOR_DIM,
     MemoryManager,
     clean_telemetry,
+    register_l1_clear_hook,
 )
 
 logger = logging.getLogger(__name__)
 
 # Optional local embedder (e.g. sentence-transformers). L3 vectors default to placeholder if missing.
 _embedder = None
+_EMBED_MODEL = "all-MiniLM-L6-v2"
+_RERANK_MODEL = "BAAI/bge-reranker-base"
+# Dynamic int8 (quint8, AVX2) export in the model repo, as written by sentence-transformers'
+# export_dynamic_quantized_onnx_model(model, "avx2", ...).
+_INT8_ONNX_FILE = "onnx/model_quint8_avx2.onnx"
+
+
+def _quantize_mode() -> str:
+    """PHYSICLAW_QUANTIZE: int8 (ONNX Runtime, CPU), fp16 (CUDA only) or off (default fp32)."""
+    v = os.getenv("PHYSICLAW_QUANTIZE", "off").strip().lower()
+    return v if v in ("int8", "fp16") else "off"
+
+
+def _half_on_cuda(model: Any) -> None:
+    # fp16 halves bandwidth on GPU; on CPU it is slower, so leave fp32 there.
+    device = getattr(model, "device", getattr(model, "_target_device", "cpu"))
+    if not str(device).startswith("cuda"):
+        return
+    try:
+        getattr(model, "model", model).half()  # CrossEncoder wraps the HF model
+    except Exception as e:
+        logger.warning("fp16 conversion failed, staying fp32: %s", e)
 
 
 def _get_embedder():
@@ -32,10 +63,24 @@ def _get_embedder():
         return _embedder
     try:
         from sentence_transformers import SentenceTransformer
-        _embedder = SentenceTransformer("all-MiniLM-L6-v2")
-        return _embedder
     except ImportError:
         return None
+    mode = _quantize_mode()
+    if mode == "int8":
+        try:
+            # Pre-quantized dynamic int8 export shipped with the model (needs sentence-transformers[onnx])
+            _embedder = SentenceTransformer(
+                _EMBED_MODEL,
+                backend="onnx",
+                model_kwargs={"file_name": _INT8_ONNX_FILE},
+            )
+            return _embedder
+        except Exception as e:
+            logger.warning("int8 ONNX embedder unavailable, using default: %s", e)
+    _embedder = SentenceTransformer(_EMBED_MODEL)
+    if mode == "fp16":
+        _half_on_cuda(_embedder)
+    return _embedder
 
 
 # Optional reranker (e.g. bge-reranker-base). Improves RAG quality without cloud.
@@ -46,26 +91,117 @@ def _get_reranker():
     global _reranker_model
     if _reranker_model is not None:
         return _reranker_model
+    mode = _quantize_mode()
     try:
         from sentence_transformers import CrossEncoder
-        _reranker_model = CrossEncoder("BAAI/bge-reranker-base", max_length=512)
+        if mode == "int8":
+            try:
+                # Same int8 file as the embedder; plain backend="onnx" would load the fp32 export
+                _reranker_model = CrossEncoder(
+                    _RERANK_MODEL,
+                    max_length=512,
+                    backend="onnx",
+                    model_kwargs={"file_name": _INT8_ONNX_FILE},
+                )
+                return _reranker_model
+            except Exception as e:
+                logger.warning("int8 ONNX reranker unavailable, using default: %s", e)
+        _reranker_model = CrossEncoder(_RERANK_MODEL, max_length=512)
+        if mode == "fp16":
+            _half_on_cuda(_reranker_model)
         return _reranker_model
     except Exception:
         try:
             from FlagEmbedding import FlagReranker
-            _reranker_model = FlagReranker("BAAI/bge-reranker-base", use_fp16=True)
+            _reranker_model = FlagReranker(_RERANK_MODEL, use_fp16=True)
             return _reranker_model
         except ImportError:
             return None
 
 
-def embed_text(text: str) -> list[float]:
-    """Return 384-dim vector for text. Placeholder zeros if no local embedder."""
+# Embedding cache: blake2b(scrubbed text) -> read-only float32 vector. Embeddings are
+# deterministic for the loaded model, so entries never go stale within a process.
+_EMBED_CACHE_MAX = 4096
+_embed_cache: OrderedDict[bytes, np.ndarray] = OrderedDict()
+_embed_cache_lock = threading.Lock()
+
+
+@register_l1_clear_hook
+def _clear_embed_cache() -> None:
+    with _embed_cache_lock:
+        _embed_cache.clear()
+
+
+def _embed_key(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+def _embed_cache_get(key: bytes) -> np.ndarray | None:
+    with _embed_cache_lock:
+        vec = _embed_cache.get(key)
+        if vec is not None:
+            _embed_cache.move_to_end(key)
+        return vec
+
+
+def _embed_cache_put(key: bytes, vec: np.ndarray) -> None:
+    vec.setflags(write=False)  # shared between callers
+    with _embed_cache_lock:
+        _embed_cache[key] = vec
+        _embed_cache.move_to_end(key)
+        if len(_embed_cache) > _EMBED_CACHE_MAX:
+            _embed_cache.popitem(last=False)
+
+
+def embed_text(text: str) -> np.ndarray:
+    """Return 384-dim float32 vector for text. Placeholder zeros if no local embedder."""
     emb = _get_embedder()
     if emb is None:
-        return [0.0] * 384
-    vec = emb.encode(clean_telemetry(text), normalize_embeddings=True)
-    return vec.tolist()
+        return np.zeros(VECTOR_DIM, dtype=np.float32)
+    text = clean_telemetry(text)
+    key = _embed_key(text)
+    cached = _embed_cache_get(key)
+    if cached is not None:
+        return cached
+    vec = np.asarray(
+        emb.encode(text, normalize_embeddings=True, convert_to_numpy=True), dtype=np.float32
+    )
+    _embed_cache_put(key, vec)
+    return vec
+
+
+def embed_texts(texts: list[str], batch_size: int = 64) -> np.ndarray:
+    """Batch form of embed_text: (len(texts), 384) float32, one encode call over all uncached texts."""
+    if not texts:
+        return np.zeros((0, VECTOR_DIM), dtype=np.float32)
+    emb = _get_embedder()
+    if emb is None:
+        return np.zeros((len(texts), VECTOR_DIM), dtype=np.float32)
+    cleaned = [clean_telemetry(t) for t in texts]
+    keys = [_embed_key(t) for t in cleaned]
+    out = np.empty((len(texts), VECTOR_DIM), dtype=np.float32)
+    # Encode each distinct missing text once
+    missing: dict[bytes, list[int]] = {}
+    for i, k in enumerate(keys):
+        cached = _embed_cache_get(k)
+        if cached is None:
+            missing.setdefault(k, []).append(i)
+        else:
+            out[i] = cached
+    if missing:
+        vecs = np.asarray(
+            emb.encode(
+                [cleaned[idx[0]] for idx in missing.values()],
+                batch_size=batch_size,
+                normalize_embeddings=True,
+                convert_to_numpy=True,
+            ),
+            dtype=np.float32,
+        )
+        for (k, idx), vec in zip(missing.items(), vecs):
+            out[idx] = vec
+            _embed_cache_put(k, vec.copy())
+    return out
 
 
 def rerank_query_docs(query: str, docs: list[str], top_k: int = 5) -> list[tuple[int, float]]:
@@ -87,7 +223,7 @@ def rerank_query_docs(query: str, docs: list[str], top_k: int = 5) -> list[tuple
             return indexed[:top_k]
         # CrossEncoder
         inputs = [[query, d] for d in docs]
-        scores = model.predict(inputs)
+        scores = model.predict(inputs, batch_size=32)
         if not hasattr(scores, "__len__"):
             scores = [scores]
         indexed = [(i, float(scores[i]) if i < len(scores) else 0.0) for i in range(len(docs))]
@@ -98,6 +234,22 @@ def rerank_query_docs(query: str, docs: list[str], top_k: int = 5) -> list[tuple
         return [(i, 0.0) for i in range(min(top_k, len(docs)))]
 
 
+# Worker threads for retrieve_for_llm; PHYSICLAW_MEMORY_PARALLEL=0 keeps it sequential.
+_pool: ThreadPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def _retrieval_pool() -> ThreadPoolExecutor | None:
+    global _pool
+    if os.getenv("PHYSICLAW_MEMORY_PARALLEL", "1").strip().lower() in ("0", "false", "no", "off"):
+        return None
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="physiclaw-retrieval")
+    return _pool
+
+
 class MemoryEngine:
     """
     High-level memory: L2 for infrastructure facts (cluster names, IP maps),
@@ -138,6 +290,24 @@ class MemoryEngine:
         if self.l3:
             self.l3.add(text, source=source or "log", vector=vector)
 
+    def add_documents(self, docs: list[tuple[str, str]]) -> None:
+        """Bulk add_document: docs are (text, source_path); embedded and written in one batch."""
+        self._add_many(docs, "doc")
+
+    def add_log_chunks(self, chunks: list[tuple[str, str]]) -> None:
+        """Bulk add_log_chunk: chunks are (text, source); embedded and written in one batch."""
+        self._add_many(chunks, "log")
+
+    def _add_many(self, items: list[tuple[str, str]], default_source: str) -> None:
+        if not self.l3 or not items:
+            return
+        texts = [clean_telemetry(text) for text, _ in items]
+        vectors = embed_texts(texts)
+        self.l3.add_many([
+            {"text": text, "source": source or default_source, "vector": vector}
+            for text, (_, source), vector in zip(texts, items, vectors)
+        ])
+
     def search_semantic(self, query: str, limit: int = 10) -> list[dict[str, Any]]:
         """Semantic search in L3. Returns list of {text, source, id, ...}."""
         if not self.l3:
@@ -164,11 +334,27 @@ class MemoryEngine:
             except ImportError:
                 pass
 
+        def _timed(layer: str, fn, *args: Any) -> list[dict[str, Any]]:
+            t = time.perf_counter()
+            try:
+                return fn(*args)
+            finally:
+                _record(layer, time.perf_counter() - t)
+
         t0 = time.perf_counter()
         results: list[dict[str, Any]] = []
 
-        t_l2 = time.perf_counter()
-        for row in self.search_infrastructure(query, limit=l2_limit):
+        # L3 (query embedding + vector search) overlaps with the L2 FTS query on this thread
+        pool = _retrieval_pool()
+        if pool is not None:
+            f_l3 = pool.submit(_timed, "l3", self.search_semantic, query, l3_limit)
+            l2_rows = _timed("l2", self.search_infrastructure, query, l2_limit)
+            l3_rows = f_l3.result()
+        else:
+            l2_rows = _timed("l2", self.search_infrastructure, query, l2_limit)
+            l3_rows = _timed("l3", self.search_semantic, query, l3_limit)
+
+        for row in l2_rows:
             results.append({
                 "text": row.get("body", ""),
                 "source": row.get("tags", "l2"),
@@ -176,10 +362,8 @@ class MemoryEngine:
                 "tier": "l2",
                 "id": row.get("id"),
             })
-        _record("l2", time.perf_counter() - t_l2)
 
-        t_l3 = time.perf_counter()
-        for row in self.search_semantic(query, limit=l3_limit):
+        for row in l3_rows:
             results.append({
                 "text": row.get("text", ""),
                 "source": row.get("source", "l3"),
@@ -187,7 +371,6 @@ class MemoryEngine:
                 "tier": "l3",
                 "id": row.get("id"),
             })
-        _record("l3", time.perf_counter() - t_l3)
 
         if not results:
             _record("combined", time.perf_counter() - t0)
@@ -7,16 +7,25 @@ from __future__ import annotations
 
 import os
 import re
+import secrets
 import sqlite3
+import threading
+import time
+import weakref
 from collections import OrderedDict
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
-# Optional: lancedb for L3. Fail at runtime if not installed.
+import numpy as np
+
+# Optional: lancedb (and its pyarrow dependency) for L3. Fail at runtime if not installed.
 try:
     import lancedb
+    import pyarrow as pa
 except ImportError:
     lancedb = None
+    pa = None
 
 BASE_DIR = Path(os.getenv("PHYSICLAW_MEMORY_DIR", ".physiclaw")).expanduser()
 L2_PATH = BASE_DIR / "memory_l2.sqlite3"
@@ -39,6 +48,10 @@ TELEMETRY_STRINGS = [
     "posthog",
     "segment.com",
 ]
+# Patterns and literals run as separate ordered passes, exactly like the original loop: a
+# fused alternation takes the leftmost match, so one needle can consume the prefix another
+# needs and leave its secret unredacted.
+_TRIGGER_LITERALS = tuple(TELEMETRY_STRINGS)
 
 
 def clean_telemetry(text: str) -> str:
@@ -48,46 +61,136 @@ def clean_telemetry(text: str) -> str:
     """
     if not text or not isinstance(text, str):
         return text
+    # Every pattern needs ":" or "=", and literals only match verbatim, so text with
+    # neither cannot change. Substring checks are C-speed scans; the regex is not.
+    if ":" not in text and "=" not in text and not any(s in text for s in _TRIGGER_LITERALS):
+        return text
     out = text
     for pat in TELEMETRY_PATTERNS:
         out = pat.sub("[REDACTED]", out)
-    for s in TELEMETRY_STRINGS:
-        out = out.replace(s, "[REDACTED]")
+    for s in _TRIGGER_LITERALS:
+        if s in out:  # C-speed scan; only replace what is present
+            out = out.replace(s, "[REDACTED]")
     return out
 
 
 # --- Tier 1: L1 Ephemeral (in-memory LRU) ------------------------------------
 
 
+# Live L1 caches plus clear hooks for other in-process caches of memory content (e.g. the
+# engine's embedding cache), so a wipe can drop them without a process restart.
+_l1_caches: weakref.WeakSet[LRUCache] = weakref.WeakSet()
+_l1_clear_hooks: list[Callable[[], None]] = []
+
+
+def register_l1_clear_hook(fn: Callable[[], None]) -> Callable[[], None]:
+    """Register fn to run on clear_l1_cache(). Returns fn (usable as a decorator)."""
+    _l1_clear_hooks.append(fn)
+    return fn
+
+
+def clear_l1_cache() -> None:
+    """Clear every in-process L1 cache: all live LRUCache instances and registered hooks."""
+    for cache in list(_l1_caches):
+        cache.clear()
+    for fn in _l1_clear_hooks:
+        fn()
+
+
 class LRUCache:
     """In-memory LRU cache for immediate context. Volatile, not persisted."""
 
     def __init__(self, capacity: int = 1024):
         self.capacity = capacity
         self._data: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()  # callers share one cache across threadpool workers
+        _l1_caches.add(self)
 
     def get(self, key: str) -> str | None:
-        if key not in self._data:
-            return None
-        self._data.move_to_end(key)
-        return self._data[key]
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            return self._data[key]
 
     def put(self, key: str, value: str) -> None:
         value = clean_telemetry(value)
-        if key in self._data:
-            self._data.move_to_end(key)
-        else:
-            if len(self._data) >= self.capacity:
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+            elif len(self._data) >= self.capacity:
                 self._data.popitem(last=False)
-        self._data[key] = value
+            self._data[key] = value
 
     def clear(self) -> None:
-        self._data.clear()
+        with self._lock:
+            self._data.clear()
 
 
 # --- Tier 2: L2 Factual (SQLite FTS5) ----------------------------------------
 
 
+def _ulid() -> str:
+    """Time-ordered 24-hex-char id: 48-bit ms timestamp + 48 random bits."""
+    return f"{time.time_ns() // 1_000_000:012X}{secrets.token_hex(6).upper()}"
+
+
+def _ulids(n: int) -> list[str]:
+    """n _ulid()-style ids from one urandom read, sorted so a batch is written in id order."""
+    prefix = f"{time.time_ns() // 1_000_000:012X}"
+    raw = secrets.token_bytes(6 * n).hex().upper()
+    return sorted(prefix + raw[i:i + 12] for i in range(0, 12 * n, 12))
+
+
+# Kept as constants so sqlite3's statement cache reuses the compiled plans.
+_L2_INSERT = "INSERT INTO facts (id, body, tags) VALUES (?, ?, ?)"
+_L2_TRIGGER_AI = """
+    CREATE TRIGGER IF NOT EXISTS facts_ai AFTER INSERT ON facts BEGIN
+        INSERT INTO facts_fts(rowid, body, tags) VALUES (new.rowid, new.body, new.tags);
+    END;
+"""
+# Above this many rows add_many indexes the batch with one INSERT ... SELECT instead of
+# firing facts_ai once per row.
+_L2_BULK_THRESHOLD = 1000
+_L2_SEARCH = """
+    SELECT f.id, f.body, f.tags, f.created_at
+    FROM facts_fts fts
+    JOIN facts f ON f.rowid = fts.rowid
+    WHERE facts_fts MATCH ?
+    ORDER BY bm25(facts_fts, 10.0, 2.0)
+    LIMIT ?
+"""
+# Default separators: prod-east, 10.0.0.1 or kube-system/coredns index as their parts, so
+# plain words (prod, coredns, "healthy." at a sentence end) still match. _fts_query turns
+# each query term into a phrase, which matches the whole identifier as adjacent parts.
+_L2_FTS_TOKENIZE = "unicode61 remove_diacritics 2"
+_L2_CREATE_FTS = f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS facts_fts USING fts5(
+        body,
+        tags,
+        content='facts',
+        content_rowid='rowid',
+        tokenize="{_L2_FTS_TOKENIZE}"
+    );
+"""
+
+
+def _fts_query(query: str) -> str:
+    """
+    FTS5 MATCH expression for a plain-text query: every whitespace-separated term becomes
+    a quoted string (all must match), so prod-east, kube-system or 10.0.0.5 are searched
+    as phrases instead of parsed as column filters or operators. A trailing * is kept as
+    a prefix query (prod* -> "prod"*).
+    """
+    terms = []
+    for t in query.split():
+        star = t.endswith("*")
+        t = t.rstrip("*")
+        if t:
+            terms.append('"' + t.replace('"', '""') + '"' + ("*" if star else ""))
+    return " ".join(terms)
+
+
 class L2Store:
     """SQLite FTS5 for structured infrastructure state lookups."""
 
@@ -95,7 +198,14 @@ class L2Store:
         path = path or L2_PATH
         path.parent.mkdir(parents=True, exist_ok=True)
         self._path = path
-        self._conn = sqlite3.connect(str(path))
+        # Autocommit connection shared across threads; _lock serializes access to it.
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._lock = threading.RLock()
+        cur = self._conn.cursor()
+        cur.execute("PRAGMA journal_mode=WAL")
+        cur.execute("PRAGMA synchronous=NORMAL")
+        cur.execute("PRAGMA temp_store=MEMORY")
+        cur.execute("PRAGMA mmap_size=268435456")
         self._init_schema()
 
     def _init_schema(self) -> None:
@@ -110,23 +220,23 @@ class L2Store:
             );
             """
         )
-        cur.execute(
-            """
-            CREATE VIRTUAL TABLE IF NOT EXISTS facts_fts USING fts5(
-                body,
-                tags,
-                content='facts',
-                content_rowid='rowid'
-            );
-            """
-        )
-        cur.execute(
-            """
-            CREATE TRIGGER IF NOT EXISTS facts_ai AFTER INSERT ON facts BEGIN
-                INSERT INTO facts_fts(rowid, body, tags) VALUES (new.rowid, new.body, new.tags);
-            END;
-            """
-        )
+        row = cur.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'facts_fts'"
+        ).fetchone()
+        if row is not None and f'tokenize="{_L2_FTS_TOKENIZE}"' not in row[0]:
+            # Index built with another tokenizer: recreate it and reindex from facts
+            cur.execute("BEGIN IMMEDIATE")
+            try:
+                cur.execute("DROP TABLE facts_fts")
+                cur.execute(_L2_CREATE_FTS)
+                cur.execute("INSERT INTO facts_fts(facts_fts) VALUES ('rebuild')")
+            except BaseException:
+                cur.execute("ROLLBACK")
+                raise
+            cur.execute("COMMIT")
+        else:
+            cur.execute(_L2_CREATE_FTS)
+        cur.execute(_L2_TRIGGER_AI)
         cur.execute(
             """
             CREATE TRIGGER IF NOT EXISTS facts_ad AFTER DELETE ON facts BEGIN
@@ -138,27 +248,44 @@ class L2Store:
 
     def add(self, body: str, tags: str = "") -> None:
         body = clean_telemetry(body)
-        cur = self._conn.cursor()
-        cur.execute(
-            "INSERT INTO facts (id, body, tags) VALUES (hex(randomblob(8)), ?, ?)",
-            (body, tags),
-        )
-        self._conn.commit()
+        with self._lock:
+            self._conn.execute(_L2_INSERT, (_ulid(), body, tags))
+
+    def add_many(self, rows: list[tuple[str, str]]) -> None:
+        """Insert (body, tags) rows in one transaction instead of one commit per row."""
+        if not rows:
+            return
+        params = [
+            (id_, clean_telemetry(body), tags) for id_, (body, tags) in zip(_ulids(len(rows)), rows)
+        ]
+        bulk = len(params) > _L2_BULK_THRESHOLD
+        with self._lock:
+            cur = self._conn.cursor()
+            cur.execute("BEGIN IMMEDIATE" if bulk else "BEGIN")
+            try:
+                if bulk:
+                    prev_max = cur.execute("SELECT coalesce(max(rowid), 0) FROM facts").fetchone()[0]
+                    cur.execute("DROP TRIGGER IF EXISTS facts_ai")
+                    cur.executemany(_L2_INSERT, params)
+                    cur.execute(
+                        "INSERT INTO facts_fts(rowid, body, tags) "
+                        "SELECT rowid, body, tags FROM facts WHERE rowid > ?",
+                        (prev_max,),
+                    )
+                    cur.execute(_L2_TRIGGER_AI)
+                else:
+                    cur.executemany(_L2_INSERT, params)
+            except BaseException:
+                cur.execute("ROLLBACK")
+                raise
+            cur.execute("COMMIT")
 
     def search(self, query: str, limit: int = 20) -> list[dict[str, Any]]:
-        cur = self._conn.cursor()
-        cur.execute(
-            """
-            SELECT f.id, f.body, f.tags, f.created_at
-            FROM facts_fts fts
-            JOIN facts f ON f.rowid = fts.rowid
-            WHERE facts_fts MATCH ?
-            ORDER BY rank
-            LIMIT ?
-            """,
-            (query, limit),
-        )
-        rows = cur.fetchall()
+        match = _fts_query(query)
+        if not match:
+            return []
+        with self._lock:
+            rows = self._conn.execute(_L2_SEARCH, (match, limit)).fetchall()
         return [
             {"id": r[0], "body": r[1], "tags": r[2], "created_at": r[3]}
             for r in rows
@@ -168,6 +295,9 @@ class L2Store:
 # --- Tier 3: L3 Semantic (LanceDB) --------------------------------------------
 
 
+VECTOR_DIM = 384
+
+
 class L3Store:
     """Local LanceDB for semantic search. Embeddings must be computed locally."""
 
@@ -180,23 +310,56 @@ class L3Store:
         self._db = lancedb.connect(str(path.parent))
         self._table_name = "semantic"
         if self._table_name not in self._db.table_names():
+            # New tables store vectors as fp16; half the bytes of float32 on disk and in scans
             self._db.create_table(
                 self._table_name,
-                data=[{"id": "", "text": "", "source": "", "vector": [0.0] * 384}],
+                schema=pa.schema([
+                    pa.field("id", pa.string()),
+                    pa.field("text", pa.string()),
+                    pa.field("source", pa.string()),
+                    pa.field("vector", pa.list_(pa.float16(), VECTOR_DIM)),
+                ]),
             )
         self._table = self._db.open_table(self._table_name)
+        # Tables created by older versions hold float32 vectors; write/query in whatever is stored
+        self._schema = self._table.schema
+        vector_type = self._schema.field("vector").type
+        self._vector_type = vector_type
+        self._vector_dtype = np.float16 if vector_type.value_type == pa.float16() else np.float32
+
+    def add(self, text: str, source: str = "", vector: np.ndarray | list[float] | None = None) -> None:
+        self.add_many([{"text": text, "source": source, "vector": vector}])
+
+    def add_many(self, rows: list[dict[str, Any]]) -> None:
+        """Insert rows of {text, source, vector} with a single table write."""
+        if not rows:
+            return
+        # Rows without a vector keep the zero placeholder; replace with local embedder
+        vectors = np.zeros((len(rows), VECTOR_DIM), dtype=self._vector_dtype)
+        for i, row in enumerate(rows):
+            if row.get("vector") is not None:
+                vectors[i] = row["vector"]
+        if isinstance(self._vector_type, pa.FixedSizeListType):
+            vector_col = pa.FixedSizeListArray.from_arrays(
+                pa.array(vectors.reshape(-1), type=self._vector_type.value_type), VECTOR_DIM
+            )
+        else:
+            vector_col = pa.array(list(vectors), type=self._vector_type)
+        batch = pa.Table.from_pydict(
+            {
+                "id": pa.array(_ulids(len(rows)), type=pa.string()),
+                "text": pa.array([clean_telemetry(row.get("text", "")) for row in rows], type=pa.string()),
+                "source": pa.array([row.get("source", "") for row in rows], type=pa.string()),
+                "vector": vector_col,
+            },
+            schema=self._schema,
+        )
+        self._table.add(batch)
 
-    def add(self, text: str, source: str = "", vector: list[float] | None = None) -> None:
-        text = clean_telemetry(text)
-        if vector is None:
-            vector = [0.0] * 384  # placeholder; replace with local embedder
-        import uuid
-        row = {"id": str(uuid.uuid4()), "text": text, "source": source, "vector": vector}
-        self._table.add([row])
-
-    def search(self, vector: list[float], limit: int = 10) -> list[dict[str, Any]]:
-        rs = self._table.search(vector).limit(limit)
-        return [dict(row) for row in rs.to_pylist()]
+    def search(self, vector: np.ndarray | list[float], limit: int = 10) -> list[dict[str, Any]]:
+        query = np.asarray(vector, dtype=self._vector_dtype)
+        rs = self._table.search(query).limit(limit)
+        return [dict(row) for row in rs.to_list()]
 
 
 # --- Manager facade ----------------------------------------------------------
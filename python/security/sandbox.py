@@ -9,6 +9,7 @@ cross-contamination between personas.
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
 import shutil
@@ -21,9 +22,24 @@ logger = logging.getLogger(__name__)
 BWRAP_BIN = "bwrap"
 
 
-def bwrap_available() -> bool:
-    """Return True if bubblewrap (bwrap) is on PATH and usable."""
+def _find_bwrap() -> str | None:
     path = shutil.which(BWRAP_BIN)
+    return path if path and os.access(path, os.X_OK) else None
+
+
+# Resolved once at import; the host layout does not change under a running process.
+_BWRAP_PATH = _find_bwrap()
+
+
+def _bwrap_path() -> str | None:
+    """Resolved, executable bwrap path (None if not installed)."""
+    return _BWRAP_PATH
+
+
+@functools.lru_cache(maxsize=1)
+def bwrap_available() -> bool:
+    """Return True if bubblewrap (bwrap) is on PATH and usable. Probed once per process."""
+    path = _bwrap_path()
     if not path:
         return False
     try:
@@ -38,18 +54,36 @@ def bwrap_available() -> bool:
         return False
 
 
-def _ro_bind_args() -> list[str]:
+def _compute_ro_bind_args() -> tuple[str, ...]:
     """Build read-only bind args for a minimal root. Prefer /usr, /bin, /lib, /etc."""
     args: list[str] = []
     # Order matters: bind parent before child when overlapping
     for mount in ["/usr", "/bin", "/lib", "/lib64", "/etc"]:
-        p = Path(mount)
-        if p.exists():
-            args.extend(["--ro-bind", str(p), str(p)])
+        if os.path.exists(mount):
+            args.extend(["--ro-bind", mount, mount])
     if not args:
         # Fallback: at least /usr (contains bin on many distros)
         args = ["--ro-bind", "/usr", "/usr"]
-    return args
+    return tuple(args)
+
+
+_RO_BIND_ARGS = _compute_ro_bind_args()
+
+# Fixed leading bwrap args: ro-bind system dirs, dev, proc, tmpfs /tmp.
+_BWRAP_PREFIX: tuple[str, ...] = (
+    _BWRAP_PATH or BWRAP_BIN,
+    "--die-with-parent",
+    "--new-session",
+    *_RO_BIND_ARGS,
+    "--dev", "/dev",
+    "--proc", "/proc",
+    "--tmpfs", "/tmp",
+    "--dir", "/run",
+)
+
+
+def _ro_bind_args() -> tuple[str, ...]:
+    return _RO_BIND_ARGS
 
 
 def run_in_bwrap(
@@ -62,8 +96,7 @@ def run_in_bwrap(
     """
     Run argv in a bubblewrap sandbox. Returns same shape as ToolExecutor._run_isolated.
     """
-    bwrap = shutil.which(BWRAP_BIN)
-    if not bwrap:
+    if not _BWRAP_PATH:
         return {
             "ok": False,
             "error": "bwrap not found; install bubblewrap or set PHYSICLAW_SANDBOX=0",
@@ -72,16 +105,7 @@ def run_in_bwrap(
         }
 
     # Minimal sandbox: ro-bind system dirs, dev, proc, tmpfs /tmp, no network
-    bwrap_args = [
-        bwrap,
-        "--die-with-parent",
-        "--new-session",
-        *_ro_bind_args(),
-        "--dev", "/dev",
-        "--proc", "/proc",
-        "--tmpfs", "/tmp",
-        "--dir", "/run",
-    ]
+    bwrap_args = list(_BWRAP_PREFIX)
     if allow_network:
         bwrap_args.extend(["--unshare-all", "--share-net"])
     else:
@@ -102,14 +126,13 @@ def run_in_bwrap(
             env=env or os.environ,
             cwd=bwrap_cwd,
             capture_output=True,
-            text=True,
             timeout=timeout_sec,
         )
         return {
             "ok": result.returncode == 0,
             "returncode": result.returncode,
-            "stdout": result.stdout or "",
-            "stderr": result.stderr or "",
+            "stdout": result.stdout.decode("utf-8", "replace"),
+            "stderr": result.stderr.decode("utf-8", "replace"),
         }
     except subprocess.TimeoutExpired:
         return {"ok": False, "error": "command timed out", "stdout": "", "stderr": ""}
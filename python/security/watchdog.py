@@ -8,9 +8,12 @@ triggers an immediate process exit with a security violation log.
 
 from __future__ import annotations
 
+import functools
 import ipaddress
 import logging
 import os
+import socket
+import struct
 import sys
 import threading
 import time
@@ -35,21 +38,204 @@ SAFE_SUBNETS = [
 ]
 
 
+# SAFE_SUBNETS as (network int, prefix len) per family for plain bit compares.
+_SAFE_V4 = tuple((int(n.network_address), n.prefixlen) for n in SAFE_SUBNETS if n.version == 4)
+_SAFE_V6 = tuple((int(n.network_address), n.prefixlen) for n in SAFE_SUBNETS if n.version == 6)
+
+
+def _parse_ip(s: str) -> tuple[int, int] | None:
+    """(bits, int value) for an IPv4/IPv6 literal; IPv4-mapped IPv6 counts as IPv4."""
+    try:
+        return 32, int.from_bytes(socket.inet_pton(socket.AF_INET, s), "big")
+    except OSError:
+        pass
+    try:
+        value = int.from_bytes(socket.inet_pton(socket.AF_INET6, s), "big")
+    except OSError:
+        return None
+    if value >> 32 == 0xFFFF:  # ::ffff:a.b.c.d
+        return 32, value & 0xFFFFFFFF
+    return 128, value
+
+
+@functools.lru_cache(maxsize=1024)
 def _ip_in_safe_subnets(ip_str: str) -> bool:
     """Return True if the given IP string is inside any SAFE_SUBNETS."""
     if not ip_str or ip_str in ("", "*"):
         return True
-    # Strip port if present (e.g. "192.168.1.1:443" -> "192.168.1.1")
-    if "%" in ip_str:
-        ip_str = ip_str.split("%")[0]
-    if ":" in ip_str and "]" not in ip_str:
-        # IPv4 with port
-        ip_str = ip_str.split(":")[0]
-    try:
-        ip = ipaddress.ip_address(ip_str)
-    except ValueError:
+    host = ip_str
+    if host.startswith("["):
+        # "[v6]:port"
+        host = host[1:].split("]", 1)[0]
+    # Strip zone id (e.g. "fe80::1%eth0")
+    host = host.split("%", 1)[0]
+    parsed = _parse_ip(host)
+    if parsed is None and host.count(":") == 1:
+        # IPv4 with port (e.g. "192.168.1.1:443" -> "192.168.1.1")
+        parsed = _parse_ip(host.split(":", 1)[0])
+    if parsed is None:
         return False
-    return any(ip in net for net in SAFE_SUBNETS)
+    bits, value = parsed
+    for base, prefix in _SAFE_V4 if bits == 32 else _SAFE_V6:
+        if (value ^ base) >> (bits - prefix) == 0:
+            return True
+    return False
+
+
+# /proc/net/tcp "st" column values we care about
+_TCP_STATES = {"01": "ESTABLISHED", "02": "SYN_SENT"}
+_V4_MAPPED_PREFIX = b"\x00" * 10 + b"\xff\xff"
+
+
+def _socket_inodes(pid: int) -> set[str]:
+    """Inodes of the sockets held open by pid (from /proc/<pid>/fd -> "socket:[N]")."""
+    fd_dir = f"/proc/{pid}/fd"
+    inodes: set[str] = set()
+    for name in os.listdir(fd_dir):
+        try:
+            target = os.readlink(f"{fd_dir}/{name}")
+        except OSError:
+            continue  # fd closed while scanning
+        if target.startswith("socket:["):
+            inodes.add(target[8:-1])
+    return inodes
+
+
+def _decode_proc_addr(hex_addr: str) -> tuple[str, int]:
+    """
+    Decode a /proc/net/tcp{,6} "ADDR:PORT". The kernel prints the address as 32-bit words
+    read in host byte order, so packing each word natively ("=I") restores network order
+    on little- and big-endian hosts alike.
+    """
+    host, port = hex_addr.split(":")
+    if len(host) == 8:
+        return socket.inet_ntop(socket.AF_INET, struct.pack("=I", int(host, 16))), int(port, 16)
+    raw = b"".join(struct.pack("=I", int(host[i:i + 8], 16)) for i in range(0, 32, 8))
+    if raw.startswith(_V4_MAPPED_PREFIX):
+        # ::ffff:a.b.c.d from a dual-stack socket; judge it as the IPv4 address it is
+        return socket.inet_ntop(socket.AF_INET, raw[12:]), int(port, 16)
+    return socket.inet_ntop(socket.AF_INET6, raw), int(port, 16)
+
+
+def _read_proc_net_tcp(pid: int) -> list[tuple[str, int, str]] | None:
+    """
+    (remote_ip, remote_port, status) for pid's ESTABLISHED / SYN_SENT TCP sockets, read
+    straight from /proc/<pid>/net/tcp{,6} and filtered to pid's own socket inodes.
+    Returns None if /proc is not usable (caller falls back to psutil).
+    """
+    try:
+        inodes = _socket_inodes(pid)
+    except OSError:
+        return None
+    conns: list[tuple[str, int, str]] = []
+    if not inodes:
+        return conns
+    for name in ("tcp", "tcp6"):
+        try:
+            with open(f"/proc/{pid}/net/{name}", encoding="ascii") as f:
+                next(f, None)  # header
+                for line in f:
+                    # sl local_address rem_address st tx:rx tr:tm retrnsmt uid timeout inode
+                    parts = line.split()
+                    if len(parts) < 10:
+                        continue
+                    status = _TCP_STATES.get(parts[3])
+                    if status is None or parts[9] not in inodes:
+                        continue
+                    ip_str, port = _decode_proc_addr(parts[2])
+                    conns.append((ip_str, port, status))
+        except FileNotFoundError:
+            continue  # e.g. IPv6 disabled
+        except OSError:
+            return None
+    return conns
+
+
+# NETLINK_SOCK_DIAG constants (linux/netlink.h, linux/sock_diag.h, linux/inet_diag.h)
+_NETLINK_SOCK_DIAG = 4
+_SOCK_DIAG_BY_FAMILY = 20
+_NLM_F_REQUEST = 0x1
+_NLM_F_DUMP = 0x300
+_NLMSG_ERROR = 2
+_NLMSG_DONE = 3
+_NLMSG_HDR = struct.Struct("=IHHII")  # len, type, flags, seq, pid
+_INET_DIAG_REQ_V2 = struct.Struct("=BBBBI48s")  # family, protocol, ext, pad, states, sockid
+_INET_DIAG_MSG_LEN = 72
+_INET_DIAG_INODE = struct.Struct("=I")  # idiag_inode at offset 68 of inet_diag_msg
+_DIAG_STATES = {1: "ESTABLISHED", 2: "SYN_SENT"}  # TCP_ESTABLISHED, TCP_SYN_SENT
+_DIAG_STATE_MASK = sum(1 << s for s in _DIAG_STATES)
+
+
+def _read_diag_dump(
+    sk: socket.socket, inodes: set[int], conns: list[tuple[str, int, str]]
+) -> bool:
+    """Consume one sock_diag dump, appending pid-owned sockets. False on NLMSG_ERROR."""
+    while True:
+        data = sk.recv(65536)
+        if not data:
+            return False
+        off = 0
+        while off + _NLMSG_HDR.size <= len(data):
+            length, msg_type, _, _, _ = _NLMSG_HDR.unpack_from(data, off)
+            if msg_type == _NLMSG_DONE:
+                return True
+            if msg_type == _NLMSG_ERROR or length < _NLMSG_HDR.size:
+                return False
+            body = off + _NLMSG_HDR.size
+            if msg_type == _SOCK_DIAG_BY_FAMILY and length >= _NLMSG_HDR.size + _INET_DIAG_MSG_LEN:
+                (inode,) = _INET_DIAG_INODE.unpack_from(data, body + 68)
+                status = _DIAG_STATES.get(data[body + 1])
+                if status is not None and inode in inodes:
+                    port = int.from_bytes(data[body + 6:body + 8], "big")
+                    dst = data[body + 24:body + 40]
+                    if data[body] == socket.AF_INET:
+                        ip_str = socket.inet_ntop(socket.AF_INET, dst[:4])
+                    elif dst.startswith(_V4_MAPPED_PREFIX):
+                        ip_str = socket.inet_ntop(socket.AF_INET, dst[12:])
+                    else:
+                        ip_str = socket.inet_ntop(socket.AF_INET6, dst)
+                    conns.append((ip_str, port, status))
+            off += (length + 3) & ~3
+
+
+def _read_sock_diag(pid: int) -> list[tuple[str, int, str]] | None:
+    """
+    (remote_ip, remote_port, status) for pid's ESTABLISHED / SYN_SENT TCP sockets via a
+    NETLINK_SOCK_DIAG dump, filtered to pid's own socket inodes. The kernel applies the
+    state filter, so idle listeners never cross into userspace. Returns None where
+    netlink is unavailable (non-Linux, seccomp) so the caller falls back to /proc.
+    """
+    if not hasattr(socket, "AF_NETLINK"):
+        return None
+    try:
+        inodes = {int(i) for i in _socket_inodes(pid)}
+    except OSError:
+        return None
+    conns: list[tuple[str, int, str]] = []
+    if not inodes:
+        return conns
+    try:
+        with socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, _NETLINK_SOCK_DIAG) as sk:
+            sk.settimeout(2.0)
+            for seq, family in enumerate((socket.AF_INET, socket.AF_INET6), 1):
+                req = _INET_DIAG_REQ_V2.pack(
+                    family, socket.IPPROTO_TCP, 0, 0, _DIAG_STATE_MASK, b""
+                )
+                sk.send(
+                    _NLMSG_HDR.pack(
+                        _NLMSG_HDR.size + len(req),
+                        _SOCK_DIAG_BY_FAMILY,
+                        _NLM_F_REQUEST | _NLM_F_DUMP,
+                        seq,
+                        0,
+                    )
+                    + req
+                )
+                if not _read_diag_dump(sk, inodes, conns):
+                    return None
+    except OSError:
+        return None
+    return conns
 
 
 def _check_connections(pid: int) -> list[tuple[str, int, str]]:
@@ -57,6 +243,20 @@ def _check_connections(pid: int) -> list[tuple[str, int, str]]:
     Return list of (remote_ip, remote_port, status) for connections
     that are outside SAFE_SUBNETS. Only considers ESTABLISHED and SYN_SENT.
     """
+    try:
+        conns = _read_sock_diag(pid)
+    except (ValueError, IndexError, struct.error) as e:
+        logger.warning("Egress watchdog sock_diag parse failed, using /proc: %s", e)
+        conns = None
+    if conns is not None:
+        return [c for c in conns if not _ip_in_safe_subnets(c[0])]
+    try:
+        conns = _read_proc_net_tcp(pid)
+    except (ValueError, IndexError) as e:
+        logger.warning("Egress watchdog /proc parse failed, using psutil: %s", e)
+        conns = None
+    if conns is not None:
+        return [c for c in conns if not _ip_in_safe_subnets(c[0])]
     if psutil is None:
         return []
     violations: list[tuple[str, int, str]] = []
@@ -104,12 +304,13 @@ def start_egress_watchdog(interval_sec: float = 5.0) -> threading.Thread | None:
     network connections. If any connection targets an IP outside SAFE_SUBNETS,
     the process exits with code 1 and a critical log.
 
-    Returns the thread if started, or None if psutil is not installed.
+    Connections are read via netlink sock_diag, then /proc/<pid>/net/tcp{,6}; psutil
+    is the fallback where /proc is unavailable. Returns the thread if started, or None if neither is usable.
     """
-    if psutil is None:
-        logger.warning("Egress watchdog disabled: psutil not installed. pip install psutil")
-        return None
     pid = os.getpid()
+    if psutil is None and not os.path.isdir(f"/proc/{pid}/fd"):
+        logger.warning("Egress watchdog disabled: no /proc and psutil not installed. pip install psutil")
+        return None
     thread = threading.Thread(
         target=_watchdog_loop,
         args=(pid, interval_sec),
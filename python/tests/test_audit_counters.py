@@ -0,0 +1,48 @@
+"""
+Per-thread Prometheus counters: exited threads are folded in, not kept in the registry.
+Run from python/: python -m unittest discover -s tests
+"""
+
+from __future__ import annotations
+
+import threading
+import unittest
+
+from core import audit
+
+_KEY = (("persona", "test"),)
+
+
+def _bump(n: int) -> None:
+    for _ in range(n):
+        audit._inc("goals_total", _KEY)
+
+
+class ThreadCountersTest(unittest.TestCase):
+    def setUp(self) -> None:
+        audit._snapshot_counters(reset=True)
+
+    def test_exited_threads_are_pruned_and_counted(self) -> None:
+        for _ in range(50):
+            t = threading.Thread(target=_bump, args=(3,))
+            t.start()
+            t.join()
+        before = len(audit._thread_counters)
+        totals = audit._snapshot_counters()
+        self.assertEqual(totals["goals_total"][_KEY], 150)
+        self.assertLess(len(audit._thread_counters), before)
+        self.assertFalse(any(ref() is None or not ref().is_alive() for ref, _ in audit._thread_counters))
+        # Folded counts persist across snapshots until a reset.
+        self.assertEqual(audit._snapshot_counters()["goals_total"][_KEY], 150)
+        self.assertEqual(audit._snapshot_counters(reset=True)["goals_total"][_KEY], 150)
+        self.assertNotIn(_KEY, audit._snapshot_counters()["goals_total"])
+
+    def test_live_thread_keeps_counting(self) -> None:
+        _bump(2)
+        self.assertEqual(audit._snapshot_counters()["goals_total"][_KEY], 2)
+        _bump(1)
+        self.assertEqual(audit._snapshot_counters()["goals_total"][_KEY], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
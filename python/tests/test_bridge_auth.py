@@ -0,0 +1,65 @@
+"""
+/goal auth guard: requests FastAPI would reject as malformed keep their 422, and empty
+credential headers count as missing (401). Run from python/: python -m unittest discover -s tests
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from fastapi.testclient import TestClient
+
+import bridge
+
+_GOAL = b'{"goal": "check disk", "persona": "sre"}'
+
+
+class GoalAuthTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        env = mock.patch.dict(
+            os.environ,
+            {
+                "PHYSICLAW_API_KEYS": "sre:k1",
+                "PHYSICLAW_REQUIRE_AUTH": "1",
+                "PHYSICLAW_MEMORY_DIR": tmp.name,  # audit_log writes here
+            },
+        )
+        env.start()
+        self.addCleanup(env.stop)
+        self.addCleanup(bridge._load_auth_config)  # back to the unpatched env
+        bridge._load_auth_config()
+        self.client = TestClient(bridge.app)  # no lifespan: the routes never reach memory
+
+    def _post(self, content_type: str | None, **headers: str) -> int:
+        if content_type is not None:
+            headers["content-type"] = content_type
+        return self.client.post("/goal", content=_GOAL, headers=headers).status_code
+
+    def test_non_json_content_type_is_validated_first(self) -> None:
+        for ct in ("text/plain", "application/x-www-form-urlencoded", "application/jsonx"):
+            with self.subTest(content_type=ct):
+                self.assertEqual(self._post(ct), 422)
+                self.assertEqual(self._post(ct, **{"x-physiclaw-key": "bad"}), 422)
+
+    def test_json_content_types_are_authenticated(self) -> None:
+        for ct in ("application/json", "application/json; charset=utf-8", "application/goal+json"):
+            with self.subTest(content_type=ct):
+                self.assertEqual(self._post(ct), 401)
+                self.assertEqual(self._post(ct, **{"x-physiclaw-key": "bad"}), 403)
+
+    def test_empty_credentials_count_as_missing(self) -> None:
+        self.assertEqual(self._post("application/json", **{"x-physiclaw-key": ""}), 401)
+        self.assertEqual(self._post("application/json", authorization=""), 401)
+
+    def test_malformed_json_body_gets_422(self) -> None:
+        resp = self.client.post("/goal", json={"persona": "sre"}, headers={"x-physiclaw-key": "bad"})
+        self.assertEqual(resp.status_code, 422)
+
+
+if __name__ == "__main__":
+    unittest.main()
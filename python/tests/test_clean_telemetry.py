@@ -0,0 +1,64 @@
+"""
+Regression check: clean_telemetry must redact exactly like the original per-pattern loop.
+Run from python/: python -m unittest discover -s tests
+"""
+
+from __future__ import annotations
+
+import random
+import unittest
+
+from core.memory.manager import TELEMETRY_PATTERNS, TELEMETRY_STRINGS, clean_telemetry
+
+
+def _baseline(text: str) -> str:
+    # The original implementation, kept verbatim as the reference.
+    out = text
+    for pat in TELEMETRY_PATTERNS:
+        out = pat.sub("[REDACTED]", out)
+    for s in TELEMETRY_STRINGS:
+        out = out.replace(s, "[REDACTED]")
+    return out
+
+
+# (input, baseline output); the first three leaked a secret with a single fused regex.
+_GOLDEN = [
+    ("api_key:posthog = phc_LIVESECRET", "[REDACTED]"),
+    ("token=segment : wk_LIVESECRET", "[REDACTED]"),
+    ("export TOKEN=mixpanel: abc123", "export [REDACTED]"),
+    ("GET https://app.posthog.com/e 200", "GET [REDACTED] 200"),
+    ("api-key = abc def", "[REDACTED] def"),
+    ("call report_usage() then phone-home", "call [REDACTED]() then [REDACTED]"),
+    ("TELEMETRY telemetry", "TELEMETRY [REDACTED]"),
+    ("plain log line without secrets", "plain log line without secrets"),
+    ("", ""),
+]
+
+_ATOMS = [
+    "api_key", "API-KEY", "apikey", "token", "TOKEN", "posthog", "PostHog", "segment",
+    "mixpanel", "amplitude", "fullstory", "http://", "https://", "ph.", "sentry.io",
+    "telemetry", "analytics", "phone-home", "phone_home", "send_analytics", "report_usage",
+    "segment.com", "=", ":", " ", "  ", "\n", "\t", "x", "abc", "phc_LIVE", "export ",
+    "1", ".", "/", "_", "-",
+]
+
+
+class CleanTelemetryTest(unittest.TestCase):
+    def test_golden_outputs(self) -> None:
+        for text, expected in _GOLDEN:
+            with self.subTest(text=text):
+                self.assertEqual(_baseline(text), expected)
+                self.assertEqual(clean_telemetry(text), expected)
+
+    def test_matches_baseline_fuzz(self) -> None:
+        rng = random.Random(1337)
+        for _ in range(50_000):
+            text = "".join(rng.choice(_ATOMS) for _ in range(rng.randint(1, 12)))
+            self.assertEqual(clean_telemetry(text), _baseline(text), repr(text))
+
+    def test_non_str_passthrough(self) -> None:
+        self.assertIsNone(clean_telemetry(None))  # type: ignore[arg-type]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+L2 FTS recall: plain words and infra identifiers (hyphens, dots, slashes) must both match.
+Run from python/: python -m unittest discover -s tests
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from core.memory.manager import L2Store
+
+_FACTS = [
+    "cluster prod-east is healthy.",
+    "pod kube-system/coredns restarted at 10.0.0.5",
+    "prod west east",
+]
+
+
+class L2SearchTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "l2.sqlite3"
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _store(self) -> L2Store:
+        store = L2Store(self.path)
+        for body in _FACTS:
+            store.add(body)
+        return store
+
+    def _bodies(self, store: L2Store, query: str) -> list[str]:
+        return sorted(r["body"] for r in store.search(query))
+
+    def test_plain_words(self) -> None:
+        store = self._store()
+        self.assertEqual(self._bodies(store, "healthy"), [_FACTS[0]])
+        self.assertEqual(self._bodies(store, "coredns"), [_FACTS[1]])
+        self.assertEqual(self._bodies(store, "prod"), sorted([_FACTS[0], _FACTS[2]]))
+
+    def test_infra_identifiers(self) -> None:
+        store = self._store()
+        for query in ("prod-east", "kube-system", "10.0.0.5", "kube-system/coredns"):
+            with self.subTest(query=query):
+                self.assertEqual(len(store.search(query)), 1)
+        self.assertEqual(self._bodies(store, "prod-east"), [_FACTS[0]])
+
+    def test_query_syntax_is_literal(self) -> None:
+        store = self._store()
+        for query in ('a"b', "NOT", "OR healthy", "*", "", "body:healthy"):
+            with self.subTest(query=query):
+                store.search(query)  # must not raise sqlite3.OperationalError
+        self.assertEqual(len(store.search("pro*")), 2)
+
+    def test_reindexes_tokenchars_index(self) -> None:
+        self._store()._conn.close()
+        conn = sqlite3.connect(self.path)
+        conn.executescript(
+            """
+            DROP TABLE facts_fts;
+            CREATE VIRTUAL TABLE facts_fts USING fts5(
+                body, tags, content='facts', content_rowid='rowid',
+                tokenize="unicode61 tokenchars '-_./' remove_diacritics 2"
+            );
+            INSERT INTO facts_fts(facts_fts) VALUES ('rebuild');
+            """
+        )
+        conn.close()
+        store = L2Store(self.path)
+        self.assertEqual(self._bodies(store, "healthy"), [_FACTS[0]])
+
+
+if __name__ == "__main__":
+    unittest.main()
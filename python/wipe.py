@@ -9,67 +9,374 @@ from __future__ import annotations
 
 import logging
 import os
-import shutil
+import sys
+import time
 from pathlib import Path
 
-from core.memory.manager import BASE_DIR, L2_PATH, L3_PATH
+# shutil, subprocess, threading and core.memory.manager (which pulls in the memory stack)
+# are imported where used, so `python -m wipe` without --all exits before loading them.
 
 logger = logging.getLogger(__name__)
 
+# fd-relative removal needs dir_fd support for open/unlink/rmdir and scandir(fd) (POSIX).
+_DIR_FD_OK = {os.open, os.unlink, os.rmdir} <= os.supports_dir_fd and os.scandir in os.supports_fd
+_O_PARENT = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0) | getattr(os, "O_CLOEXEC", 0)
+_O_DIR = _O_PARENT | getattr(os, "O_NOFOLLOW", 0)
 
-def wipe_all(include_base_dir: bool = True) -> dict[str, bool]:
+
+def _rmtree_fd(dfd: int) -> None:
+    """
+    Empty the directory open as dfd; every entry is resolved relative to its parent fd.
+    Entries that disappear mid-walk (FileNotFoundError) are already gone, not errors.
+    """
+    with os.scandir(dfd) as it:
+        for entry in it:
+            try:
+                # d_type from readdir: no stat per entry. Symlinks are unlinked, never followed.
+                if entry.is_dir(follow_symlinks=False):
+                    sub = os.open(entry.name, _O_DIR, dir_fd=dfd)
+                    try:
+                        _rmtree_fd(sub)
+                    finally:
+                        os.close(sub)
+                    os.rmdir(entry.name, dir_fd=dfd)
+                else:
+                    os.unlink(entry.name, dir_fd=dfd)
+            except FileNotFoundError:
+                continue
+
+
+def _fast_rmtree(path: Path | str, dir_fd: int | None = None) -> None:
+    """
+    shutil.rmtree without per-entry path resolution (unlinkat/rmdir against dir fds).
+    With dir_fd, path is a name relative to that already-open parent directory.
+    """
+    if not _DIR_FD_OK:
+        import shutil
+
+        shutil.rmtree(path)
+        return
+    dfd = os.open(path, _O_DIR, dir_fd=dir_fd)
+    try:
+        _rmtree_fd(dfd)
+    finally:
+        os.close(dfd)
+    os.rmdir(path, dir_fd=dir_fd)
+
+
+def _open_dir(path: str) -> int | None:
+    """fd for directory path (followed if it is a symlink), or None without dir_fd support."""
+    return os.open(path, _O_PARENT) if _DIR_FD_OK else None
+
+
+def _parent(path: str) -> str:
+    return os.path.dirname(path) or os.curdir
+
+
+_O_FILE = os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0) | getattr(os, "O_CLOEXEC", 0)
+
+
+def _drop_page_cache(path: str, dir_fd: int | None = None) -> None:
+    """
+    Evict path's clean cached pages (POSIX_FADV_DONTNEED) before it is unlinked, so a
+    wiped DB does not linger in RAM until reclaim. No fsync first: dirty pages of an
+    unlinked file are discarded anyway, and flushing them would only write the data out.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, _O_FILE, dir_fd=dir_fd)
+    except OSError:
+        return  # unlink reports the real error, if any
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _mountpoint(path: str) -> str:
+    p = os.path.realpath(path)
+    while not os.path.exists(p):  # the wiped dir itself is gone; use its nearest ancestor
+        p = os.path.dirname(p)
+    while not os.path.ismount(p):
+        p = os.path.dirname(p)
+    return p
+
+
+def _is_rotational(mountpoint: str) -> bool:
+    """True if the block device behind mountpoint is spinning media (sysfs, Linux only)."""
+    dev = os.stat(mountpoint).st_dev
+    base = f"/sys/dev/block/{os.major(dev)}:{os.minor(dev)}"
+    # Whole disks carry queue/ themselves; partitions inherit it from the parent disk.
+    for q in (f"{base}/queue/rotational", f"{base}/../queue/rotational"):
+        try:
+            with open(q, encoding="ascii") as f:
+                return f.read().strip() == "1"
+        except OSError:
+            continue
+    return False
+
+
+def _trim_free_blocks(path: str) -> bool:
+    """
+    Discard the filesystem's free blocks (fstrim) so unlinked data is not left on SSD
+    cells until GC. Skipped on rotational disks. Returns True if the trim ran cleanly.
+    """
+    import shutil
+    import subprocess
+
+    try:
+        if sys.platform == "win32":
+            drive = os.path.splitdrive(os.path.abspath(path))[0]
+            argv = ["defrag.exe", drive, "/L"]
+        else:
+            mountpoint = _mountpoint(path)
+            if _is_rotational(mountpoint):
+                logger.info("Wipe: %s is on rotational media; skipping trim", mountpoint)
+                return False
+            fstrim = shutil.which("fstrim")
+            if fstrim is None:
+                logger.warning("Wipe: fstrim not found; freed blocks were not discarded")
+                return False
+            argv = [fstrim, mountpoint]
+        r = subprocess.run(argv, capture_output=True, timeout=300, check=False)
+    except (OSError, subprocess.TimeoutExpired) as e:
+        logger.warning("Wipe: trim failed: %s", e)
+        return False
+    if r.returncode != 0:
+        logger.warning("Wipe: trim failed (%s): %s", r.returncode, r.stderr.decode("utf-8", "replace").strip())
+        return False
+    logger.info("Wipe: discarded free blocks (%s)", " ".join(argv[1:]))
+    return True
+
+
+def _reclaim(base_dir: str, names: list[str], secure: bool) -> None:
+    """Delete the chosen scratch trees (siblings of base_dir), then trim if secure."""
+    parent = _parent(base_dir)
+    pfd = _open_dir(parent)
+    try:
+        for name in names:
+            try:
+                _fast_rmtree(name if pfd is not None else os.path.join(parent, name), dir_fd=pfd)
+            except FileNotFoundError:
+                continue  # another wipe reclaimed it
+            except OSError as e:
+                logger.warning("Wipe: could not remove %s: %s", os.path.join(parent, name), e)
+    finally:
+        if pfd is not None:
+            os.close(pfd)
+    logger.info("Wipe: reclaimed %d retired tree(s) next to %s", len(names), base_dir)
+    if secure:
+        _trim_free_blocks(base_dir)
+
+
+# A scratch dir older than this is an interrupted wipe's leftover even if its PID is alive
+# again (reused).
+_STALE_SCRATCH_NS = 3600 * 10**9
+
+
+def _stale_scratch(suffix: str, now_ns: int) -> bool:
+    """
+    True if the scratch dir with this "<pid>.<ns>" suffix was left by a dead process or is
+    over an hour old. A live process may still be reclaiming it, so it is left alone.
+    """
+    pid_s, _, ns_s = suffix.partition(".")
+    if not (pid_s.isdigit() and ns_s.isdigit()):
+        return False  # not a name _retire_base_dir makes
+    if now_ns - int(ns_s) > _STALE_SCRATCH_NS:
+        return True
+    pid = int(pid_s)
+    if pid == os.getpid():
+        return False  # an earlier wipe of this process; its reclaim thread owns it
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return True
+    except OSError:
+        pass  # EPERM: alive, owned by another user
+    return False
+
+
+def _retire_base_dir(base_dir: str, secure: bool) -> None:
+    """
+    Rename base_dir to a scratch sibling ".<name>.wiping.<pid>.<ns>". rename(2) on one
+    filesystem is atomic, so the memory is gone from its path before this returns. A
+    non-daemon thread then deletes the scratch tree (plus stale leftovers of interrupted
+    wipes) and trims; the interpreter waits for it at exit. If the rename fails, base_dir
+    is deleted in place first.
+    """
+    import threading
+
+    from core.audit import release_audit_fd
+
+    # The audit writer's cached fd would keep appending into the renamed tree.
+    release_audit_fd()
+    prefix = f".{os.path.basename(base_dir).lstrip('.')}.wiping."
+    parent = _parent(base_dir)
+    now_ns = time.time_ns()
+    own = f"{prefix}{os.getpid()}.{now_ns}"
+    names: list[str] = []
+    try:
+        os.replace(base_dir, os.path.join(parent, own))
+        names.append(own)
+    except OSError as e:
+        if isinstance(e, FileNotFoundError):
+            raise
+        logger.warning("Wipe: could not move %s aside (%s); deleting in place", base_dir, e)
+        _fast_rmtree(base_dir)
+    with os.scandir(parent) as it:
+        names += [
+            e.name
+            for e in it
+            if e.name.startswith(prefix)
+            and e.name != own
+            and _stale_scratch(e.name[len(prefix):], now_ns)
+            and e.is_dir(follow_symlinks=False)
+        ]
+    threading.Thread(
+        target=_reclaim,
+        args=(base_dir, names, secure),
+        name="physiclaw-wipe-reclaim",
+        daemon=False,
+    ).start()
+
+
+def wipe_all(include_base_dir: bool = True, secure: bool = True) -> dict[str, bool]:
     """
-    Securely delete all persisted memory: L2 SQLite, L3 LanceDB, and optionally
-    the entire .physiclaw directory. In-process L1 (LRU) is not cleared here;
-    restart the process to clear L1.
+    Securely delete all memory: this process's L1 caches (no restart needed), L2 SQLite,
+    L3 LanceDB, and optionally the entire .physiclaw directory. With secure, the
+    filesystem's free blocks are trimmed afterwards so SSDs actually drop the deleted data.
+
+    The base dir is renamed aside and deleted in the background (see _retire_base_dir),
+    so the call returns once the data is unreachable; its trim outcome is logged by the
+    reclaim thread instead of being reported in "trim".
 
-    Returns dict of { "l2": deleted?, "l3": deleted?, "base_dir": deleted? }.
+    Returns dict of { "l1": cleared?, "l2": deleted?, "l3": deleted?, "base_dir": deleted?,
+    "trim": trimmed? }.
     """
-    result: dict[str, bool] = {"l2": False, "l3": False, "base_dir": False}
+    from core.memory.manager import BASE_DIR, L2_PATH, L3_PATH, clear_l1_cache
 
-    if include_base_dir and BASE_DIR.exists():
+    # Plain strings from here on: os.* calls take them directly, no Path objects per op.
+    base = os.fspath(BASE_DIR)
+
+    result: dict[str, bool] = {"l1": False, "l2": False, "l3": False, "base_dir": False, "trim": False}
+
+    clear_l1_cache()
+    result["l1"] = True
+    logger.info("Wipe: cleared in-process L1 caches")
+
+    # L2 and L3 live directly under BASE_DIR (core.memory.manager). One readdir of it
+    # answers every exists()/is_dir() below from the entries' cached d_type, and its fd
+    # stays open so removals resolve relative to it (entry.path is then the bare name).
+    base_fd: int | None = None
+    try:
+        base_fd = _open_dir(base)
+        with os.scandir(base if base_fd is None else base_fd) as it:
+            present = {e.name: e for e in it}
+    except FileNotFoundError:
+        return result  # nothing persisted
+    except OSError as e:
+        logger.warning("Wipe: could not list %s: %s", base, e)
+        if base_fd is not None:
+            os.close(base_fd)
+        return result
+    try:
+        _wipe_present(present, base_fd, result, include_base_dir, secure, base, L2_PATH.name, L3_PATH.name)
+    finally:
+        if base_fd is not None:
+            os.close(base_fd)
+
+    if secure and not result["base_dir"] and (result["l2"] or result["l3"]):
+        result["trim"] = _trim_free_blocks(base)
+    return result
+
+
+def _wipe_present(
+    present: dict[str, os.DirEntry[str]],
+    base_fd: int | None,
+    result: dict[str, bool],
+    include_base_dir: bool,
+    secure: bool,
+    base_dir: str,
+    l2_name: str,
+    l3_name: str,
+) -> None:
+    if include_base_dir:
         try:
-            shutil.rmtree(BASE_DIR)
+            _retire_base_dir(base_dir, secure)
             result["base_dir"] = True
             result["l2"] = True
             result["l3"] = True
-            logger.info("Wipe: removed base directory %s (L1/L2/L3 data)", BASE_DIR)
-            return result
+            logger.info("Wipe: removed base directory %s (L1/L2/L3 data)", base_dir)
+            return
         except OSError as e:
             logger.warning("Wipe: could not remove base dir: %s", e)
 
-    # Per-file wipe when not removing entire base
-    try:
-        if L2_PATH.exists():
-            L2_PATH.unlink()
-            result["l2"] = True
-            logger.info("Wipe: removed L2 SQLite at %s", L2_PATH)
-    except OSError as e:
-        logger.warning("Wipe: could not remove L2: %s", e)
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    lock = threading.Lock()
+    removed: list[str] = []  # logged once at the end, not per path
+
+    def wipe_l2(entries: list[os.DirEntry[str]]) -> None:
+        for entry in entries:
+            p = os.path.join(base_dir, entry.name)
+            _drop_page_cache(entry.path, dir_fd=base_fd)
+            try:
+                os.unlink(entry.path, dir_fd=base_fd)
+            except FileNotFoundError:
+                continue  # e.g. -wal checkpointed away since the scan
+            except OSError as e:
+                logger.warning("Wipe: could not remove L2 file %s: %s", p, e)
+            else:
+                with lock:
+                    result["l2"] = True
+                    removed.append(p)
 
-    l3_parent = L3_PATH.parent
-    for name in ("semantic.lance", "memory_l3.lance", L3_PATH.name):
-        p = l3_parent / name
+    def wipe_l3(entry: os.DirEntry[str]) -> None:
+        p = os.path.join(base_dir, entry.name)
         try:
-            if p.exists():
-                if p.is_dir():
-                    shutil.rmtree(p)
-                else:
-                    p.unlink()
-                result["l3"] = True
-                logger.info("Wipe: removed L3 path %s", p)
+            if entry.is_dir(follow_symlinks=False):
+                _fast_rmtree(entry.path, dir_fd=base_fd)
+            else:
+                _drop_page_cache(entry.path, dir_fd=base_fd)
+                os.unlink(entry.path, dir_fd=base_fd)
+        except FileNotFoundError:
+            return  # removed by someone else since the scan
         except OSError as e:
             logger.warning("Wipe: could not remove %s: %s", p, e)
+        else:
+            with lock:
+                result["l3"] = True
+                removed.append(p)
 
-    return result
+    # WAL mode leaves -wal/-shm sidecars next to the DB
+    l2_names = (l2_name, *(l2_name + s for s in ("-wal", "-shm", "-journal")))
+    l2 = [present[n] for n in l2_names if n in present]
+    l3_names = dict.fromkeys(("semantic.lance", "memory_l3.lance", l3_name))
+    l3 = [present[n] for n in l3_names if n in present]
+
+    # Per-tier wipe when not removing entire base. The tiers are independent and
+    # syscall-bound (the GIL is released in unlink/rmdir), so they run side by side.
+    with ThreadPoolExecutor(max_workers=1 + len(l3), thread_name_prefix="physiclaw-wipe") as pool:
+        futures = [pool.submit(wipe_l2, l2), *(pool.submit(wipe_l3, e) for e in l3)]
+    for f in futures:
+        f.result()
+    if removed and logger.isEnabledFor(logging.INFO):
+        logger.info("Wipe: removed %d L2/L3 paths: %s", len(removed), ", ".join(sorted(removed)))
 
 
 def main() -> None:
-    import sys
-    logging.basicConfig(level=logging.INFO)
     if "--all" not in sys.argv:
         print("Usage: python -m wipe --all", file=sys.stderr)
         sys.exit(2)
+    logging.basicConfig(level=logging.INFO)
     r = wipe_all(include_base_dir=True)
     print("Wipe complete:", r)
     sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,11 +7,16 @@ Exit 0 = no flagged deps; exit 1 = one or more flagged (or pip failed).
 
 from __future__ import annotations
 
+import mmap
 import re
-import subprocess
 import sys
 from pathlib import Path
 
+try:
+    import ahocorasick  # pyahocorasick, optional
+except ImportError:
+    ahocorasick = None
+
 # Packages (or substrings in package names) known for telemetry / phone-home.
 # Add more as needed; check transitive deps with pip show / pip freeze.
 TELEMETRY_PACKAGES = frozenset({
@@ -39,6 +44,66 @@ TELEMETRY_SUBSTRINGS = [
     "ph_",
 ]
 
+# Requirement name ends at the first space or version operator (==, >=, <, ...)
+_SPLIT = re.compile(rb"[\s=<>]")
+# ASCII A-Z -> a-z; package names are ASCII, so one translate() folds case
+_FOLD = bytes.maketrans(bytes(range(0x41, 0x5B)), bytes(range(0x61, 0x7B)))
+
+# Packages and substrings are one needle set; a needle containing another needle
+# (e.g. "segment-analytics" vs "segment") can never add a match, so it is dropped.
+_ALL_NEEDLES = TELEMETRY_PACKAGES | frozenset(TELEMETRY_SUBSTRINGS)
+_NEEDLES = tuple(sorted(
+    n for n in _ALL_NEEDLES if not any(o != n and o in n for o in _ALL_NEEDLES)
+))
+_NEEDLES_B = tuple(n.encode() for n in _NEEDLES)
+
+
+def _build_automaton():
+    automaton = ahocorasick.Automaton()
+    for needle in _NEEDLES:
+        automaton.add_word(needle, needle)
+    automaton.make_automaton()
+    return automaton
+
+
+# All needles in one automaton: one linear pass per name instead of a scan per needle.
+_AUTOMATON = _build_automaton() if ahocorasick is not None else None
+
+
+def _flag_names(names: list[bytes]) -> set[bytes]:
+    """Names containing any telemetry needle."""
+    if _AUTOMATON is not None:
+        return {n for n in names if next(_AUTOMATON.iter(n.decode("utf-8", "replace")), None) is not None}
+    # No automaton: one C-level bytes.find scan of all names per needle, rather than a
+    # Python-level `in` test per (name, needle) pair.
+    blob = b"\n".join(names) + b"\n"
+    flagged: set[bytes] = set()
+    for needle in _NEEDLES_B:
+        i = blob.find(needle)
+        while i != -1:
+            start = blob.rfind(b"\n", 0, i) + 1
+            end = blob.find(b"\n", i)
+            flagged.add(blob[start:end])
+            i = blob.find(needle, end + 1)
+    return flagged
+
+
+def _requirement_names(req_file: Path) -> list[bytes]:
+    """Lower-cased requirement names, read line by line from an mmap of req_file."""
+    names: list[bytes] = []
+    with req_file.open("rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file cannot be mapped
+            return names
+        with mm:
+            for raw in iter(mm.readline, b""):
+                line = raw.strip()
+                # Ignore comments, blank lines; package==version -> package
+                if line and not line.startswith(b"#"):
+                    names.append(_SPLIT.split(line, maxsplit=1)[0].translate(_FOLD))
+    return names
+
 
 def main() -> int:
     repo_root = Path(__file__).resolve().parent.parent
@@ -47,31 +112,13 @@ def main() -> int:
         print("No python/requirements.txt found; skipping Python audit.")
         return 0
 
-    # Parse direct deps from requirements.txt (ignore comments, blank lines)
-    direct: list[str] = []
-    for line in req_file.read_text().splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        # Normalize: package==version -> package
-        name = re.split(r"[\s=<>]", line)[0].lower()
-        direct.append(name)
-
-    flagged: list[str] = []
-    for name in direct:
-        for bad in TELEMETRY_PACKAGES:
-            if bad in name:
-                flagged.append(name)
-                break
-        for sub in TELEMETRY_SUBSTRINGS:
-            if sub in name:
-                flagged.append(name)
-                break
+    direct = _requirement_names(req_file)
+    flagged = _flag_names(direct)
 
     if flagged:
         print("FLAGGED (telemetry/egress risk):")
-        for f in sorted(set(flagged)):
-            print(f"  - {f}")
+        for f in sorted(flagged):
+            print(f"  - {f.decode('utf-8', 'replace')}")
         print("Consider removal or mocking (e.g. no-op stub when PHYSICLAW_OFFLINE=true).")
         return 1
 